@@ -5,17 +5,22 @@ Streamlit アプリケーションのメインエントリーポイント。
 セッション状態管理、ページルーティング、ナビゲーションを実装。
 """
 
-from src.error_handler import handle_error, ErrorCategory, ErrorSeverity
-from src.pachinko_app import PachinkoApp
 import streamlit as st
+import functools
+import html
 import logging
+import operator
 import os
-import sys
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional
 from datetime import datetime
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Heavy application modules are imported where they are first needed so the
+# page config and first paint are not delayed by their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+    from pandas.io.formats.style import Styler
+    from src.pachinko_app import PachinkoApp
 
 
 # Page configuration
@@ -31,144 +36,283 @@ st.set_page_config(
     }
 )
 
+_LOGGER = logging.getLogger('streamlit_app')
+
+# Environment flags are fixed for the lifetime of the process
+_DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
+_SHOW_ADMIN = os.getenv('ENVIRONMENT') == 'production' or _DEBUG
+
+# Fragments rerun a page body on its own widget events instead of the whole
+# script. Older Streamlit releases lack the API, so fall back to a plain call.
+_fragment = (getattr(st, 'fragment', None) or
+             getattr(st, 'experimental_fragment', None) or
+             (lambda func: func))
+
+# Column labels for the history and per-store tables
+_HISTORY_COLUMNS = {
+    'date': "📅 日付",
+    'store_name': "🏪 店舗",
+    'machine_name': "🎰 機種",
+    'final_investment': "💰 投資",
+    'return_amount': "💸 回収",
+    'profit': "収支",
+}
+_STORE_COLUMNS = {
+    'store_name': "🏪 店舗",
+    'sessions': "回数",
+    'profit': "収支",
+    'avg_profit': "平均",
+}
+
+# Session state keys and their initial values
+_SESSION_DEFAULTS = (
+    # Authentication state
+    ('authenticated', False),
+    ('username', None),
+    ('user_id', None),
+    # Navigation state
+    ('current_page', 'login'),
+    ('previous_page', None),
+    # Application state
+    ('current_session_id', None),
+    ('session_in_progress', False),
+    # UI state
+    ('show_sidebar', True),
+    ('theme_mode', 'flashy'),
+    # Error handling state
+    ('last_error', None),
+    ('error_count', 0),
+)
 
-class StreamlitApp:
+
+@functools.lru_cache(maxsize=1)
+def _app_config_cached() -> Mapping[str, Any]:
     """
-    Streamlit アプリケーションのメインクラス。
+    Build the application configuration from the environment.
 
-    セッション状態管理、ページルーティング、ナビゲーションを担当。
+    Environment variables are fixed for the lifetime of the process, so the
+    configuration is read once and shared as a read-only mapping.
     """
+    return MappingProxyType({
+        'database': {
+            'path': os.getenv('DATABASE_PATH', 'pachinko_data.db'),
+            'auth_path': os.getenv('AUTH_DATABASE_PATH', 'pachinko_auth.db'),
+            'enable_encryption': os.getenv('ENABLE_ENCRYPTION', 'true').lower() == 'true'
+        },
+        'ui': {
+            'theme': 'flashy',
+            'enable_animations': True,
+            'mobile_optimized': True
+        },
+        'features': {
+            'offline_mode': True,
+            'export_enabled': True,
+            'advanced_stats': True
+        },
+        'security': {
+            'session_timeout': 3600,
+            'max_login_attempts': 5,
+            'password_min_length': 8
+        },
+        'deployment': {
+            'environment': os.getenv('ENVIRONMENT', 'production'),
+            'debug_mode': _DEBUG
+        }
+    })
 
-    def __init__(self):
-        """Initialize the Streamlit application."""
-        self.logger = logging.getLogger('streamlit_app')
-        self.app: Optional[PachinkoApp] = None
 
-        # Initialize session state
-        self._initialize_session_state()
+def _config_key(config: Mapping[str, Any]) -> tuple:
+    """Convert the nested app configuration into a hashable cache key."""
+    return tuple((section, tuple(values.items()))
+                 for section, values in config.items())
 
-        # Initialize the main application
-        self._initialize_app()
 
-    def _initialize_session_state(self) -> None:
-        """Initialize Streamlit session state variables."""
-        # Authentication state
-        if 'authenticated' not in st.session_state:
-            st.session_state.authenticated = False
+@st.cache_resource(show_spinner=False)
+def _build_app(cfg_key: tuple) -> "PachinkoApp":
+    """
+    Build the PachinkoApp instance shared across reruns and sessions.
+
+    Args:
+        cfg_key: Configuration produced by _config_key
 
-        if 'username' not in st.session_state:
-            st.session_state.username = None
+    Returns:
+        Initialized PachinkoApp instance
+    """
+    from src.pachinko_app import PachinkoApp
+
+    app = PachinkoApp({section: dict(values) for section, values in cfg_key})
 
-        if 'user_id' not in st.session_state:
-            st.session_state.user_id = None
+    # Raising keeps a broken instance out of the resource cache
+    if not app.is_ready():
+        raise RuntimeError("Failed to initialize application components")
 
-        # Navigation state
-        if 'current_page' not in st.session_state:
-            st.session_state.current_page = 'login'
+    _LOGGER.info("Streamlit app initialized successfully")
+    return app
 
-        if 'previous_page' not in st.session_state:
-            st.session_state.previous_page = None
 
-        # Application state
-        if 'app_initialized' not in st.session_state:
-            st.session_state.app_initialized = False
+@st.cache_data(ttl=60, show_spinner=False)
+def _free_tier_ok(user_id: Optional[str], _app: "PachinkoApp") -> bool:
+    """
+    Check the free tier limits at most once a minute per user.
 
-        if 'current_session_id' not in st.session_state:
-            st.session_state.current_session_id = None
+    Args:
+        user_id: Current user ID (None before login)
+        _app: PachinkoApp instance (excluded from hashing)
 
-        if 'session_in_progress' not in st.session_state:
-            st.session_state.session_in_progress = False
+    Returns:
+        True if within limits, False otherwise
+    """
+    return _app.check_free_tier_limits()
 
-        # UI state
-        if 'show_sidebar' not in st.session_state:
-            st.session_state.show_sidebar = True
 
-        if 'theme_mode' not in st.session_state:
-            st.session_state.theme_mode = 'flashy'
+@st.cache_data(ttl=30, show_spinner=False)
+def _deployment_info_cached(_deployment_manager) -> Dict[str, Any]:
+    """Get deployment information, refreshed at most every 30 seconds."""
+    return _deployment_manager.get_deployment_info()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _health_status_cached(_app: "PachinkoApp") -> Dict[str, Any]:
+    """Get the component health status, refreshed at most every 10 seconds."""
+    return _app.get_health_status()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_sessions(user_id: str, limit: int, _db_manager) -> list:
+    """
+    Get a user's most recent sessions, reusing results for up to a minute.
+
+    Cleared whenever the app records a new session.
+
+    Args:
+        user_id: User ID
+        limit: Maximum number of sessions to return
+        _db_manager: DatabaseManager instance (excluded from hashing)
+
+    Returns:
+        List of GameSession objects
+    """
+    return _db_manager.get_sessions(user_id, limit=limit)
+
+
+def _sessions_to_df(sessions) -> "pd.DataFrame":
+    """
+    Build a columnar view of sessions for aggregation.
+
+    Args:
+        sessions: List of GameSession objects
+
+    Returns:
+        DataFrame with one row per session; a missing profit counts as 0
+    """
+    import pandas as pd
 
-        # Error handling state
-        if 'last_error' not in st.session_state:
-            st.session_state.last_error = None
+    # One pass over the session objects, one tuple per row
+    return pd.DataFrame(
+        [(s.date, s.store_name, s.machine_name, s.final_investment,
+          s.return_amount, s.profit or 0) for s in sessions],
+        columns=['date', 'store_name', 'machine_name', 'final_investment',
+                 'return_amount', 'profit']
+    )
 
-        if 'error_count' not in st.session_state:
-            st.session_state.error_count = 0
+
+def _profit_styler(df: "pd.DataFrame", money_columns: List[str]) -> "Styler":
+    """
+    Format yen amounts and colour the profit column green/red.
+
+    Args:
+        df: Table with a 'profit' column
+        money_columns: Other columns to format as yen
+
+    Returns:
+        Styler to pass to st.dataframe
+    """
+    return (df.style
+            .format('¥{:,.0f}', subset=money_columns + ['profit'], na_rep='-')
+            .apply(lambda col: ['color: green' if v >= 0 else 'color: red'
+                                for v in col], subset=['profit']))
+
+
+@st.cache_data(show_spinner=False)
+def _sidebar_header_html(username: Optional[str]) -> str:
+    """Build the static sidebar header as a single HTML block."""
+    return (
+        "<h1>🎰 勝てるクン</h1>"
+        f"<p>ようこそ、{html.escape(str(username))}さん！</p>"
+        "<hr>"
+    )
+
+
+class StreamlitApp:
+    """
+    Streamlit アプリケーションのメインクラス。
+
+    セッション状態管理、ページルーティング、ナビゲーションを担当。
+    インスタンスは全セッションで共有されるため、セッション固有の状態は
+    st.session_state にのみ保持する。
+    """
+
+    def __init__(self):
+        """Initialize the Streamlit application."""
+        self.logger = _LOGGER
+        self.app: Optional["PachinkoApp"] = None
+
+        # Page name -> (title, body renderer taking the UI manager)
+        self._routes = {
+            'dashboard': ("📊 ダッシュボード", self._render_dashboard_page),
+            'input': ("📝 遊技記録", self._render_input_page),
+            'history': ("📋 遊技履歴", self._render_history_page),
+            'stats': ("📈 統計分析", self._render_stats_page),
+            'export': ("💾 データエクスポート",
+                       operator.methodcaller('render_export_options')),
+            'admin': ("⚙️ システム状況", self._render_admin_page),
+        }
+
+    def _initialize_session_state(self) -> None:
+        """Initialize Streamlit session state variables."""
+        for key, default in _SESSION_DEFAULTS:
+            st.session_state.setdefault(key, default)
 
     def _initialize_app(self) -> None:
         """Initialize the main PachinkoApp instance."""
         try:
-            if not st.session_state.app_initialized:
-                # Create configuration based on environment
-                config = self._get_app_config()
+            # Create configuration based on environment
+            config = self._get_app_config()
 
-                # Initialize the main application
-                self.app = PachinkoApp(config)
-
-                if self.app.is_ready():
-                    st.session_state.app_initialized = True
-                    self.logger.info("Streamlit app initialized successfully")
-                else:
-                    raise RuntimeError(
-                        "Failed to initialize application components")
-            else:
-                # Reuse existing app instance
-                if hasattr(st.session_state, '_pachinko_app'):
-                    self.app = st.session_state._pachinko_app
-                else:
-                    # Recreate if lost
-                    config = self._get_app_config()
-                    self.app = PachinkoApp(config)
-
-            # Store app instance in session state
-            st.session_state._pachinko_app = self.app
+            # Reuse the process-wide instance for this configuration
+            self.app = _build_app(_config_key(config))
 
         except Exception as e:
             self.logger.error(f"Failed to initialize app: {e}")
             st.error("アプリケーションの初期化に失敗しました。ページを再読み込みしてください。")
             try:
+                from src.error_handler import handle_error, ErrorCategory, ErrorSeverity
                 handle_error(e, ErrorCategory.SYSTEM, ErrorSeverity.CRITICAL)
             except Exception as handler_error:
                 self.logger.error(f"Error handler failed: {handler_error}")
                 st.error(f"エラー処理中に問題が発生しました: {str(e)}")
 
-    def _get_app_config(self) -> Dict[str, Any]:
+    def _get_app_config(self) -> Mapping[str, Any]:
         """Get application configuration for Streamlit deployment."""
-        return {
-            'database': {
-                'path': os.getenv('DATABASE_PATH', 'pachinko_data.db'),
-                'auth_path': os.getenv('AUTH_DATABASE_PATH', 'pachinko_auth.db'),
-                'enable_encryption': os.getenv('ENABLE_ENCRYPTION', 'true').lower() == 'true'
-            },
-            'ui': {
-                'theme': 'flashy',
-                'enable_animations': True,
-                'mobile_optimized': True
-            },
-            'features': {
-                'offline_mode': True,
-                'export_enabled': True,
-                'advanced_stats': True
-            },
-            'security': {
-                'session_timeout': 3600,
-                'max_login_attempts': 5,
-                'password_min_length': 8
-            },
-            'deployment': {
-                'environment': os.getenv('ENVIRONMENT', 'production'),
-                'debug_mode': os.getenv('DEBUG', 'false').lower() == 'true'
-            }
-        }
+        return _app_config_cached()
 
     def run(self) -> None:
         """Run the main Streamlit application."""
         try:
+            # Session state is per browser session, so set it up every run
+            self._initialize_session_state()
+
+            # Retry initialization until the main application is available
+            if self.app is None:
+                self._initialize_app()
+
             # Check if app is properly initialized
             if not self.app or not self.app.is_ready():
                 st.error("アプリケーションが正しく初期化されていません。")
                 st.stop()
 
             # Check free tier limits before proceeding
-            if not self.app.check_free_tier_limits():
+            if not _free_tier_ok(st.session_state.user_id, self.app):
                 st.stop()
 
             # Handle authentication
@@ -181,6 +325,7 @@ class StreamlitApp:
         except Exception as e:
             self.logger.error(f"Error in main application loop: {e}")
             st.error("アプリケーションエラーが発生しました。")
+            from src.error_handler import handle_error, ErrorCategory, ErrorSeverity
             handle_error(e, ErrorCategory.UI, ErrorSeverity.HIGH)
 
     def _render_authentication_page(self) -> None:
@@ -207,56 +352,92 @@ class StreamlitApp:
 
     def _render_login_form(self, auth_manager) -> None:
         """Render the login form."""
-        with st.form("login_form"):
+        with st.form("login_form", clear_on_submit=False):
             st.subheader("ログイン")
 
-            username = st.text_input("ユーザー名")
-            password = st.text_input("パスワード", type="password")
-
-            if st.form_submit_button("ログイン"):
-                if username and password:
-                    try:
-                        success, user_info = auth_manager.login_user(
-                            username, password)
-                        if success and user_info:
-                            st.session_state.authenticated = True
-                            st.session_state.username = user_info['username']
-                            st.session_state.user_id = user_info['id']
-                            st.session_state.current_page = 'dashboard'
-                            st.rerun()
-                        else:
-                            st.error("ユーザー名またはパスワードが正しくありません。")
-                    except Exception as e:
-                        st.error("ログインに失敗しました。")
-                        self.logger.error(f"Login error: {e}")
-                else:
-                    st.error("ユーザー名とパスワードを入力してください。")
+            st.text_input("ユーザー名", key="login_username")
+            st.text_input("パスワード", type="password", key="login_password")
+
+            st.form_submit_button("ログイン", on_click=self._submit_login,
+                                  args=(auth_manager,))
+            self._show_form_feedback('login_feedback')
+
+    def _submit_login(self, auth_manager) -> None:
+        """Handle login form submission (form_submit_button callback)."""
+        username = st.session_state.login_username
+        password = st.session_state.login_password
+
+        if not (username and password):
+            st.session_state.login_feedback = (
+                'error', "ユーザー名とパスワードを入力してください。")
+            return
+
+        try:
+            success, user_info = auth_manager.login_user(username, password)
+            if success and user_info:
+                # The callback runs before the rerun, which renders the app
+                st.session_state.authenticated = True
+                st.session_state.username = user_info['username']
+                st.session_state.user_id = user_info['id']
+                st.session_state.current_page = 'dashboard'
+            else:
+                st.session_state.login_feedback = (
+                    'error', "ユーザー名またはパスワードが正しくありません。")
+        except Exception as e:
+            st.session_state.login_feedback = ('error', "ログインに失敗しました。")
+            self.logger.error(f"Login error: {e}")
 
     def _render_register_form(self, auth_manager) -> None:
         """Render the registration form."""
-        with st.form("register_form"):
+        with st.form("register_form", clear_on_submit=False):
             st.subheader("新規登録")
 
-            username = st.text_input("ユーザー名（新規）")
-            email = st.text_input("メールアドレス", placeholder="example@email.com")
-            password = st.text_input("パスワード（新規）", type="password")
-            password_confirm = st.text_input("パスワード確認", type="password")
-
-            if st.form_submit_button("登録"):
-                if username and email and password and password_confirm:
-                    if password != password_confirm:
-                        st.error("パスワードが一致しません。")
-                    else:
-                        try:
-                            if auth_manager.register_user(username, email, password):
-                                st.success("アカウントが作成されました。ログインしてください。")
-                            else:
-                                st.error("アカウントの作成に失敗しました。")
-                        except Exception as e:
-                            st.error("登録に失敗しました。")
-                            self.logger.error(f"Registration error: {e}")
+            st.text_input("ユーザー名（新規）", key="register_username")
+            st.text_input("メールアドレス", placeholder="example@email.com",
+                          key="register_email")
+            st.text_input("パスワード（新規）", type="password",
+                          key="register_password")
+            st.text_input("パスワード確認", type="password",
+                          key="register_password_confirm")
+
+            st.form_submit_button("登録", on_click=self._submit_register,
+                                  args=(auth_manager,))
+            self._show_form_feedback('register_feedback')
+
+    def _submit_register(self, auth_manager) -> None:
+        """Handle registration form submission (form_submit_button callback)."""
+        username = st.session_state.register_username
+        email = st.session_state.register_email
+        password = st.session_state.register_password
+        password_confirm = st.session_state.register_password_confirm
+
+        if not (username and email and password and password_confirm):
+            st.session_state.register_feedback = (
+                'error', "すべてのフィールドを入力してください。")
+        elif password != password_confirm:
+            st.session_state.register_feedback = ('error', "パスワードが一致しません。")
+        else:
+            try:
+                if auth_manager.register_user(username, email, password):
+                    st.session_state.register_feedback = (
+                        'success', "アカウントが作成されました。ログインしてください。")
                 else:
-                    st.error("すべてのフィールドを入力してください。")
+                    st.session_state.register_feedback = (
+                        'error', "アカウントの作成に失敗しました。")
+            except Exception as e:
+                st.session_state.register_feedback = ('error', "登録に失敗しました。")
+                self.logger.error(f"Registration error: {e}")
+
+    @staticmethod
+    def _show_form_feedback(key: str) -> None:
+        """Show (once) the message a form callback left in session state."""
+        feedback = st.session_state.pop(key, None)
+        if feedback:
+            level, message = feedback
+            if level == 'success':
+                st.success(message)
+            else:
+                st.error(message)
 
     def _render_main_application(self) -> None:
         """Render the main application interface."""
@@ -268,72 +449,66 @@ class StreamlitApp:
             self._render_navigation_sidebar()
 
             # Render main content based on current page
-            if st.session_state.current_page == 'dashboard':
-                self._render_dashboard_page(ui_manager)
-            elif st.session_state.current_page == 'input':
-                self._render_input_page(ui_manager)
-            elif st.session_state.current_page == 'history':
-                self._render_history_page(ui_manager)
-            elif st.session_state.current_page == 'stats':
-                self._render_stats_page(ui_manager)
-            elif st.session_state.current_page == 'export':
-                self._render_export_page(ui_manager)
-            elif st.session_state.current_page == 'admin':
-                self._render_admin_page(ui_manager)
-            else:
+            route = self._routes.get(st.session_state.current_page)
+            if route is None:
                 st.error("不明なページです。")
+            else:
+                title, render_body = route
+                st.title(title)
+                render_body(ui_manager)
 
         except Exception as e:
             self.logger.error(f"Error in main application: {e}")
             st.error(f"メインアプリケーションでエラーが発生しました: {str(e)}")
             # Show more detailed error in development
-            if os.getenv('DEBUG', 'false').lower() == 'true':
+            if _DEBUG:
                 st.exception(e)
 
     def _render_navigation_sidebar(self) -> None:
-        """Render the navigation sidebar."""
+        """
+        Render the navigation sidebar.
+
+        Buttons update session state in on_click callbacks, which run
+        before the rerun they trigger, so each click costs one script run.
+        The sidebar is deliberately not a fragment: a page switch must
+        repaint the main pane, which a fragment-scoped rerun would leave
+        stale, and the full rerun reuses the cached app instance.
+        """
         with st.sidebar:
-            st.title("🎰 勝てるクン")
-            st.markdown(f"ようこそ、{st.session_state.username}さん！")
-            st.markdown("---")
+            st.markdown(_sidebar_header_html(st.session_state.username),
+                        unsafe_allow_html=True)
 
             # Navigation buttons
-            if st.button("📊 ダッシュボード", use_container_width=True):
-                st.session_state.current_page = 'dashboard'
-                st.rerun()
-
-            if st.button("📝 遊技記録", use_container_width=True):
-                st.session_state.current_page = 'input'
-                st.rerun()
-
-            if st.button("📋 履歴", use_container_width=True):
-                st.session_state.current_page = 'history'
-                st.rerun()
-
-            if st.button("📈 統計", use_container_width=True):
-                st.session_state.current_page = 'stats'
-                st.rerun()
-
-            if st.button("💾 エクスポート", use_container_width=True):
-                st.session_state.current_page = 'export'
-                st.rerun()
+            st.button("📊 ダッシュボード", use_container_width=True,
+                      on_click=self._goto, args=('dashboard',), key='nav_dashboard')
+            st.button("📝 遊技記録", use_container_width=True,
+                      on_click=self._goto, args=('input',), key='nav_input')
+            st.button("📋 履歴", use_container_width=True,
+                      on_click=self._goto, args=('history',), key='nav_history')
+            st.button("📈 統計", use_container_width=True,
+                      on_click=self._goto, args=('stats',), key='nav_stats')
+            st.button("💾 エクスポート", use_container_width=True,
+                      on_click=self._goto, args=('export',), key='nav_export')
 
             # Admin/deployment page (only show in production or for admin users)
-            if os.getenv('ENVIRONMENT') == 'production' or os.getenv('DEBUG', 'false').lower() == 'true':
-                if st.button("⚙️ システム状況", use_container_width=True):
-                    st.session_state.current_page = 'admin'
-                    st.rerun()
+            if _SHOW_ADMIN:
+                st.button("⚙️ システム状況", use_container_width=True,
+                          on_click=self._goto, args=('admin',), key='nav_admin')
 
             st.markdown("---")
 
             # Logout button
-            if st.button("🚪 ログアウト", use_container_width=True):
-                self._logout()
+            st.button("🚪 ログアウト", use_container_width=True,
+                      on_click=self._logout, key='nav_logout')
+
+    @staticmethod
+    def _goto(page: str) -> None:
+        """Switch the current page (navigation button callback)."""
+        st.session_state.current_page = page
 
+    @_fragment
     def _render_dashboard_page(self, ui_manager) -> None:
         """Render the dashboard page with simple UI."""
-        st.title("📊 ダッシュボード")
-
         try:
             # Get database manager
             db_manager = self.app.get_database_manager()
@@ -350,16 +525,14 @@ class StreamlitApp:
 
             # Get user sessions
             user_id = str(st.session_state.user_id)
-            sessions = db_manager.get_sessions(user_id, limit=10)
+            sessions = _cached_sessions(user_id, 10, db_manager)
 
             if sessions:
                 # Calculate basic stats
-                total_profit = sum(session.profit or 0 for session in sessions)
-                total_sessions = len(sessions)
-                win_sessions = len(
-                    [s for s in sessions if (s.profit or 0) > 0])
-                win_rate = (win_sessions / total_sessions *
-                            100) if total_sessions > 0 else 0
+                profits = _sessions_to_df(sessions)['profit']
+                total_profit = int(profits.sum())
+                total_sessions = len(profits)
+                win_rate = float((profits > 0).mean() * 100)
 
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
@@ -401,13 +574,11 @@ class StreamlitApp:
             st.error("ダッシュボードの表示中にエラーが発生しました。")
             self.logger.error(f"Dashboard error: {e}")
             # Show more detailed error in development
-            if os.getenv('DEBUG', 'false').lower() == 'true':
+            if _DEBUG:
                 st.exception(e)
 
     def _render_input_page(self, ui_manager) -> None:
         """Render the input page."""
-        st.title("📝 遊技記録")
-
         try:
             db_manager = self.app.get_database_manager()
             user_id = str(st.session_state.user_id)
@@ -461,6 +632,8 @@ class StreamlitApp:
 
                             # Save to database
                             session_id = db_manager.create_session(session)
+                            _cached_sessions.clear()
+                            st.session_state.pop('stats_cache', None)
                             st.success(f"セッションが記録されました！ (ID: {session_id})")
 
                         except Exception as e:
@@ -473,10 +646,9 @@ class StreamlitApp:
             st.error("入力ページの表示中にエラーが発生しました。")
             self.logger.error(f"Input page error: {e}")
 
+    @_fragment
     def _render_history_page(self, ui_manager) -> None:
         """Render the history page."""
-        st.title("📋 遊技履歴")
-
         try:
             db_manager = self.app.get_database_manager()
             auth_manager = self.app.get_auth_manager()
@@ -487,42 +659,19 @@ class StreamlitApp:
                 db_manager.set_encryption_manager(auth_manager)
 
             # Get all sessions
-            sessions = db_manager.get_sessions(user_id, limit=50)
+            sessions = _cached_sessions(user_id, 50, db_manager)
 
             if sessions:
                 st.subheader(f"履歴 ({len(sessions)}件)")
 
-                # Display sessions in a table-like format
-                for i, session in enumerate(sessions):
-                    with st.container():
-                        col1, col2, col3, col4, col5, col6 = st.columns(6)
-
-                        with col1:
-                            st.write(f"📅 {session.date}")
-                        with col2:
-                            # Display store name (should be decrypted)
-                            store_display = session.store_name
-                            if len(store_display) > 15:
-                                store_display = store_display[:12] + "..."
-                            st.write(f"🏪 {store_display}")
-                        with col3:
-                            # Display machine name (should be decrypted)
-                            machine_display = session.machine_name
-                            if len(machine_display) > 12:
-                                machine_display = machine_display[:9] + "..."
-                            st.write(f"🎰 {machine_display}")
-                        with col4:
-                            st.write(f"💰 ¥{session.final_investment:,}")
-                        with col5:
-                            st.write(f"💸 ¥{session.return_amount:,}")
-                        with col6:
-                            profit = session.profit or 0
-                            profit_color = "green" if profit >= 0 else "red"
-                            st.markdown(f"<span style='color: {profit_color}'>¥{profit:,}</span>",
-                                        unsafe_allow_html=True)
-
-                        if i < len(sessions) - 1:
-                            st.divider()
+                # Display sessions as a single table
+                history_df = _sessions_to_df(sessions)[list(_HISTORY_COLUMNS)]
+                st.dataframe(
+                    _profit_styler(history_df, ['final_investment', 'return_amount']),
+                    column_config=_HISTORY_COLUMNS,
+                    hide_index=True,
+                    use_container_width=True
+                )
             else:
                 st.info("まだ履歴がありません。")
 
@@ -530,33 +679,42 @@ class StreamlitApp:
             st.error("履歴の表示中にエラーが発生しました。")
             self.logger.error(f"History page error: {e}")
             # Show more detailed error in development
-            if os.getenv('DEBUG', 'false').lower() == 'true':
+            if _DEBUG:
                 st.exception(e)
 
+    @_fragment
     def _render_stats_page(self, ui_manager) -> None:
         """Render the statistics page."""
-        st.title("📈 統計分析")
-
         try:
+            import pandas as pd
+
             db_manager = self.app.get_database_manager()
             stats_calculator = self.app.get_stats_calculator()
             user_id = str(st.session_state.user_id)
 
-            # Get sessions for stats
-            sessions = db_manager.get_sessions(user_id, limit=100)
-
-            if sessions:
-                # Basic statistics
-                total_sessions = len(sessions)
-                total_investment = sum(
-                    session.final_investment for session in sessions)
-                total_return = sum(
-                    session.return_amount for session in sessions)
-                total_profit = total_return - total_investment
-                win_sessions = len(
-                    [s for s in sessions if (s.profit or 0) > 0])
-                win_rate = (win_sessions / total_sessions *
-                            100) if total_sessions > 0 else 0
+            # Filter changes are batched in a form, so the query and the
+            # aggregation below only rerun when the user submits
+            with st.form("stats_filters"):
+                limit = st.select_slider(
+                    "対象セッション数（最新）", options=[10, 50, 100, 200], value=100)
+                submitted = st.form_submit_button("更新")
+
+            # Reuse the aggregates from the previous run for the same filters
+            filters = (user_id, limit)
+            stats_cache = st.session_state.get('stats_cache')
+            if submitted or not stats_cache or stats_cache['filters'] != filters:
+                sessions = _cached_sessions(user_id, limit, db_manager)
+                stats_cache = {
+                    'filters': filters,
+                    'stats': self._aggregate_session_stats(sessions)
+                }
+                st.session_state.stats_cache = stats_cache
+
+            stats = stats_cache['stats']
+
+            if stats:
+                total_sessions = stats['total_sessions']
+                total_profit = stats['total_profit']
 
                 # Display stats
                 st.subheader("基本統計")
@@ -565,36 +723,34 @@ class StreamlitApp:
                 with col1:
                     st.metric("総セッション数", total_sessions)
                 with col2:
-                    st.metric("総投資額", f"¥{total_investment:,}")
+                    st.metric("総投資額", f"¥{stats['total_investment']:,}")
                 with col3:
-                    st.metric("総回収額", f"¥{total_return:,}")
+                    st.metric("総回収額", f"¥{stats['total_return']:,}")
                 with col4:
                     profit_delta = f"¥{total_profit:,}"
                     st.metric("総収支", profit_delta, delta=profit_delta)
 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("勝率", f"{win_rate:.1f}%")
+                    st.metric("勝率", f"{stats['win_rate']:.1f}%")
                 with col2:
                     avg_profit = total_profit / total_sessions if total_sessions > 0 else 0
                     st.metric("平均収支", f"¥{avg_profit:,.0f}")
 
                 # Store analysis
                 st.subheader("店舗別分析")
-                store_stats = {}
-                for session in sessions:
-                    store = session.store_name
-                    if store not in store_stats:
-                        store_stats[store] = {'sessions': 0, 'profit': 0}
-                    store_stats[store]['sessions'] += 1
-                    store_stats[store]['profit'] += session.profit or 0
-
-                for store, stats in store_stats.items():
-                    avg_profit = stats['profit'] / stats['sessions']
-                    profit_color = "green" if stats['profit'] >= 0 else "red"
-                    st.write(f"🏪 **{store}**: {stats['sessions']}回, "
-                             f"<span style='color: {profit_color}'>¥{stats['profit']:,}</span> "
-                             f"(平均: ¥{avg_profit:,.0f})", unsafe_allow_html=True)
+                store_df = pd.DataFrame(
+                    [(store, store_stats['sessions'], store_stats['profit'],
+                      store_stats['profit'] / store_stats['sessions'])
+                     for store, store_stats in stats['store_stats'].items()],
+                    columns=list(_STORE_COLUMNS)
+                )
+                st.dataframe(
+                    _profit_styler(store_df, ['avg_profit']),
+                    column_config=_STORE_COLUMNS,
+                    hide_index=True,
+                    use_container_width=True
+                )
 
             else:
                 st.info("統計を表示するにはセッションデータが必要です。")
@@ -603,35 +759,64 @@ class StreamlitApp:
             st.error("統計の表示中にエラーが発生しました。")
             self.logger.error(f"Stats page error: {e}")
 
-    def _render_export_page(self, ui_manager) -> None:
-        """Render the export page."""
-        st.title("💾 データエクスポート")
-        ui_manager.render_export_options()
+    @staticmethod
+    def _aggregate_session_stats(sessions) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate the figures shown on the statistics page.
+
+        Args:
+            sessions: Sessions to aggregate
+
+        Returns:
+            Dictionary of totals and per-store figures, or None if there are no sessions
+        """
+        if not sessions:
+            return None
+
+        df = _sessions_to_df(sessions)
+        total_sessions = len(df)
+        total_investment = int(df['final_investment'].sum())
+        total_return = int(df['return_amount'].sum())
+
+        # Named aggregation keeps first-seen store order with sort=False
+        by_store = df.groupby('store_name', sort=False)['profit'].agg(
+            sessions='count', profit='sum')
+        store_stats = {
+            row.Index: {'sessions': int(row.sessions), 'profit': int(row.profit)}
+            for row in by_store.itertuples()
+        }
+
+        return {
+            'total_sessions': total_sessions,
+            'total_investment': total_investment,
+            'total_return': total_return,
+            'total_profit': total_return - total_investment,
+            'win_rate': float((df['profit'] > 0).mean() * 100),
+            'store_stats': store_stats
+        }
 
     def _render_admin_page(self, ui_manager) -> None:
         """Render the admin/system status page."""
-        st.title("⚙️ システム状況")
-
         try:
+            import pandas as pd
+
             deployment_manager = self.app.get_deployment_manager()
 
             # Display deployment information
             st.subheader("🚀 デプロイメント情報")
-            deployment_info = deployment_manager.get_deployment_info()
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.metric("環境", deployment_info['environment'])
-                st.metric("プラットフォーム", deployment_info['platform'])
-                st.metric("Python バージョン",
-                          deployment_info['python_version'].split()[0])
-
-            with col2:
-                st.metric("Streamlit バージョン",
-                          deployment_info['streamlit_version'])
-                st.metric("データベース", deployment_info['database_type'])
-                st.metric("デプロイ時刻", deployment_info['deployment_time'][:19])
+            deployment_info = _deployment_info_cached(deployment_manager)
+
+            info_df = pd.DataFrame({
+                '項目': ["環境", "プラットフォーム", "Python バージョン",
+                       "Streamlit バージョン", "データベース", "デプロイ時刻"],
+                '値': [str(deployment_info['environment']),
+                      str(deployment_info['platform']),
+                      deployment_info['python_version'].split()[0],
+                      deployment_info['streamlit_version'],
+                      str(deployment_info['database_type']),
+                      deployment_info['deployment_time'][:19]]
+            })
+            st.dataframe(info_df, hide_index=True, use_container_width=True)
 
             st.markdown("---")
 
@@ -642,7 +827,7 @@ class StreamlitApp:
 
             # Display health status
             st.subheader("🏥 システムヘルス")
-            health_status = self.app.get_health_status()
+            health_status = _health_status_cached(self.app)
 
             if health_status.get('deployment', {}).get('status') == 'healthy':
                 st.success("✅ システム正常稼働中")
@@ -661,27 +846,23 @@ class StreamlitApp:
             st.subheader("🔧 機能状況")
             features = deployment_info['features_enabled']
 
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                status = "✅" if features['offline_mode'] else "❌"
-                st.write(f"{status} オフラインモード")
-
-            with col2:
-                status = "✅" if features['export_enabled'] else "❌"
-                st.write(f"{status} エクスポート機能")
-
-            with col3:
-                status = "✅" if features['advanced_stats'] else "❌"
-                st.write(f"{status} 高度統計")
-
-            with col4:
-                status = "✅" if features['animations'] else "❌"
-                st.write(f"{status} アニメーション")
+            feature_rows = [
+                ("オフラインモード", features['offline_mode']),
+                ("エクスポート機能", features['export_enabled']),
+                ("高度統計", features['advanced_stats']),
+                ("アニメーション", features['animations']),
+            ]
+            features_df = pd.DataFrame({
+                '機能': [name for name, _ in feature_rows],
+                '状態': ["✅" if enabled else "❌" for _, enabled in feature_rows]
+            })
+            st.dataframe(features_df, hide_index=True, use_container_width=True)
 
             # Manual health check button
             if st.button("🔄 ヘルスチェック実行"):
                 with st.spinner("ヘルスチェック実行中..."):
+                    # Let the next rerun pick up the fresh result
+                    _health_status_cached.clear()
                     health = deployment_manager.check_deployment_health()
                     if health['status'] == 'healthy':
                         st.success("ヘルスチェック完了: システム正常")
@@ -695,7 +876,7 @@ class StreamlitApp:
             self.logger.error(f"Error in admin page: {e}")
 
     def _logout(self) -> None:
-        """Handle user logout."""
+        """Handle user logout (logout button callback)."""
         # Clear authentication state
         st.session_state.authenticated = False
         st.session_state.username = None
@@ -706,14 +887,18 @@ class StreamlitApp:
         st.session_state.current_session_id = None
         st.session_state.session_in_progress = False
 
-        st.rerun()
+
+@st.cache_resource(show_spinner=False)
+def _get_streamlit_app() -> StreamlitApp:
+    """Get the StreamlitApp instance shared across reruns and sessions."""
+    return StreamlitApp()
 
 
 def main():
     """Main entry point for the Streamlit application."""
     try:
-        # Create and run the Streamlit app
-        app = StreamlitApp()
+        # Run the shared Streamlit app
+        app = _get_streamlit_app()
         app.run()
 
     except Exception as e:
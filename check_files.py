@@ -5,6 +5,19 @@ Check database files
 
 import os
 import sqlite3
+from urllib.parse import quote
+
+
+def list_tables(db_file):
+    """List table names, opening the database read-only."""
+    # mode=ro takes no write lock and creates no rollback journal; WAL
+    # databases still get their -wal/-shm files
+    conn = sqlite3.connect(f"file:{quote(db_file)}?mode=ro", uri=True)
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table';")]
+    finally:
+        conn.close()
 
 
 def check_files():
@@ -15,28 +28,25 @@ def check_files():
         # Check current directory
         f.write(f"Current directory: {os.getcwd()}\n\n")
 
+        # Scan the directory once; DirEntry caches type and stat results
+        entries = [entry for entry in os.scandir('.') if entry.is_file()]
+        names = {entry.name for entry in entries}
+
         # List all files
         f.write("All files in directory:\n")
-        for file in os.listdir('.'):
-            if os.path.isfile(file):
-                stat = os.stat(file)
-                f.write(f"  {file}: size={stat.st_size} bytes\n")
+        for entry in entries:
+            f.write(f"  {entry.name}: size={entry.stat().st_size} bytes\n")
         f.write("\n")
 
         # Check for database files specifically
         f.write("Database files:\n")
-        db_files = [f for f in os.listdir('.') if f.endswith('.db')]
+        db_files = [entry.name for entry in entries if entry.name.endswith('.db')]
         if db_files:
             for db_file in db_files:
                 f.write(f"  Found: {db_file}\n")
                 try:
                     # Test SQLite connection
-                    conn = sqlite3.connect(db_file)
-                    cursor = conn.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table';")
-                    tables = cursor.fetchall()
-                    f.write(f"    Tables: {[table[0] for table in tables]}\n")
-                    conn.close()
+                    f.write(f"    Tables: {list_tables(db_file)}\n")
                     f.write(f"    Status: ✅ OK\n")
                 except Exception as e:
                     f.write(f"    Status: ❌ Error: {e}\n")
@@ -48,7 +58,7 @@ def check_files():
         expected_files = ['pachinko_data.db', 'pachinko_auth.db']
         f.write("Expected database files:\n")
         for expected in expected_files:
-            if os.path.exists(expected):
+            if expected in names:
                 f.write(f"  ✅ {expected} exists\n")
             else:
                 f.write(f"  ❌ {expected} missing\n")
@@ -3,47 +3,109 @@
 Check git status and write to file
 """
 
+import io
+import shlex
+import shutil
 import subprocess
 import os
 
 
+REPO = '/Users/kurosawashun/Desktop/win-or-lose/pachinko-app'
+STATUS_FILE = os.path.join(REPO, 'git_status.txt')
+GIT = shutil.which('git') or 'git'
+
+# Sections reported by check_git_status, in output order
+GIT_SECTIONS = [
+    ("Git Status", ['git', 'status', '--porcelain']),
+    ("Git Remote", ['git', 'remote', '-v']),
+    ("Last Commit", ['git', 'log', '--oneline', '-1']),
+    ("Current Branch", ['git', 'branch']),
+]
+
+SECTION_SEPARATOR = "\0SECTION\0"
+RETURN_CODE_MARKER = "\0RC\0"
+
+
+def _printf_literal(text):
+    """Quote text as a printf format that reproduces its NUL bytes."""
+    return shlex.quote(text.replace('\0', '\\0'))
+
+
+def _git_args(args):
+    """Point a git command at REPO without changing the working directory."""
+    return [GIT, '-C', REPO] + args[1:]
+
+
+def _section_script(args):
+    """Shell for one section: its output, its exit code, then a separator.
+
+    The separator is written to stderr as well, so both streams split into
+    the same sections.
+    """
+    separator = _printf_literal(SECTION_SEPARATOR)
+    return (f"{shlex.join(_git_args(args))}; "
+            f"printf {_printf_literal(RETURN_CODE_MARKER)}'%d' \"$?\"; "
+            f"printf {separator}; printf {separator} >&2")
+
+
+def run_git_commands():
+    """
+    Run all git commands in one shell.
+
+    Returns:
+        (returncodes, stdouts, stderrs), one entry per GIT_SECTIONS item
+    """
+    script = "; ".join(_section_script(args) for _, args in GIT_SECTIONS)
+    result = subprocess.run(script, shell=True, capture_output=True, text=True)
+    sections = result.stdout.split(SECTION_SEPARATOR)
+    stderrs = result.stderr.split(SECTION_SEPARATOR)
+
+    count = len(GIT_SECTIONS)
+    if (len(sections) == len(stderrs) == count + 1
+            and all(RETURN_CODE_MARKER in part for part in sections[:count])):
+        outputs, returncodes = zip(*(part.rsplit(RETURN_CODE_MARKER, 1)
+                                     for part in sections[:count]))
+        return [int(rc) for rc in returncodes], list(outputs), stderrs[:count]
+
+    # Fall back to one subprocess per command
+    results = [subprocess.run(_git_args(args), capture_output=True, text=True)
+               for _, args in GIT_SECTIONS]
+    return ([r.returncode for r in results],
+            [r.stdout for r in results],
+            [r.stderr for r in results])
+
+
 def check_git_status():
     try:
-        # Change to the correct directory
-        os.chdir('/Users/kurosawashun/Desktop/win-or-lose/pachinko-app')
-
-        # Check git status
-        result = subprocess.run(['git', 'status', '--porcelain'],
-                                capture_output=True, text=True)
-
-        with open('git_status.txt', 'w') as f:
-            f.write("=== Git Status ===\n")
-            f.write(f"Return code: {result.returncode}\n")
-            f.write(f"Stdout:\n{result.stdout}\n")
-            f.write(f"Stderr:\n{result.stderr}\n")
-
-            # Check remote
-            remote_result = subprocess.run(['git', 'remote', '-v'],
-                                           capture_output=True, text=True)
-            f.write(f"\n=== Git Remote ===\n")
-            f.write(f"Remote stdout:\n{remote_result.stdout}\n")
-
-            # Check last commit
-            log_result = subprocess.run(['git', 'log', '--oneline', '-1'],
-                                        capture_output=True, text=True)
-            f.write(f"\n=== Last Commit ===\n")
-            f.write(f"Log stdout:\n{log_result.stdout}\n")
-
-            # Check branch
-            branch_result = subprocess.run(['git', 'branch'],
-                                           capture_output=True, text=True)
-            f.write(f"\n=== Current Branch ===\n")
-            f.write(f"Branch stdout:\n{branch_result.stdout}\n")
-
-        print("Git status written to git_status.txt")
+        returncodes, outputs, stderrs = run_git_commands()
+        status, remote, log, branch = outputs
+        returncode, stderr = returncodes[0], stderrs[0]
+
+        buf = io.StringIO()
+        write = buf.write
+
+        write("=== Git Status ===\n")
+        write(f"Return code: {returncode}\n")
+        write(f"Stdout:\n{status}\n")
+        write(f"Stderr:\n{stderr}\n")
+
+        write(f"\n=== Git Remote ===\n")
+        write(f"Remote stdout:\n{remote}\n")
+
+        write(f"\n=== Last Commit ===\n")
+        write(f"Log stdout:\n{log}\n")
+
+        write(f"\n=== Current Branch ===\n")
+        write(f"Branch stdout:\n{branch}\n")
+
+        with open(STATUS_FILE, 'w', buffering=131072) as f:
+            f.write(buf.getvalue())
+
+        print(f"Git status written to {STATUS_FILE}")
 
     except Exception as e:
-        with open('git_status.txt', 'w') as f:
+        # REPO itself may be missing, so report into the current directory
+        with open('git_status.txt', 'w', buffering=131072) as f:
             f.write(f"Error checking git status: {e}\n")
         print(f"Error: {e}")
 
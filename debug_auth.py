@@ -3,69 +3,65 @@
 Debug authentication system
 """
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from debug_common import (start_report, save_report, get_auth_manager,
+                          format_error)
 
 
 def debug_auth():
-    with open('auth_debug.txt', 'w', encoding='utf-8') as f:
-        f.write("🔍 Authentication System Debug\n")
-        f.write("=" * 50 + "\n\n")
+    buf = start_report("🔍 Authentication System Debug")
+    write = buf.write
 
+    try:
+        # Test imports
+        write("1. Testing imports...\n")
+        import src.authentication  # noqa: F401
+        write("✅ AuthenticationManager import successful\n\n")
+
+        # Check if auth database exists
+        write("2. Checking auth database file...\n")
+        auth_db_path = "pachinko_auth.db"
+        if os.path.exists(auth_db_path):
+            write(f"✅ Auth database exists: {auth_db_path}\n")
+        else:
+            write(f"❌ Auth database missing: {auth_db_path}\n")
+        write("\n")
+
+        # Test AuthenticationManager creation
+        write("3. Testing AuthenticationManager creation...\n")
         try:
-            # Test imports
-            f.write("1. Testing imports...\n")
-            from src.authentication import AuthenticationManager
-            f.write("✅ AuthenticationManager import successful\n\n")
+            auth_manager = get_auth_manager(auth_db_path)
+            write("✅ AuthenticationManager created\n")
 
-            # Check if auth database exists
-            f.write("2. Checking auth database file...\n")
-            auth_db_path = "pachinko_auth.db"
-            if os.path.exists(auth_db_path):
-                f.write(f"✅ Auth database exists: {auth_db_path}\n")
+            # Test database initialization
+            write("4. Testing database initialization...\n")
+            if hasattr(auth_manager, '_initialize_auth_database'):
+                auth_manager._initialize_auth_database()
+                write("✅ Auth database initialized\n")
             else:
-                f.write(f"❌ Auth database missing: {auth_db_path}\n")
-            f.write("\n")
+                write("❌ _initialize_auth_database method not found\n")
 
-            # Test AuthenticationManager creation
-            f.write("3. Testing AuthenticationManager creation...\n")
+            # Test user registration
+            write("5. Testing user registration...\n")
             try:
-                auth_manager = AuthenticationManager(db_path=auth_db_path)
-                f.write("✅ AuthenticationManager created\n")
-
-                # Test database initialization
-                f.write("4. Testing database initialization...\n")
-                if hasattr(auth_manager, '_initialize_auth_database'):
-                    auth_manager._initialize_auth_database()
-                    f.write("✅ Auth database initialized\n")
-                else:
-                    f.write("❌ _initialize_auth_database method not found\n")
-
-                # Test user registration
-                f.write("5. Testing user registration...\n")
-                try:
-                    result = auth_manager.register_user(
-                        "test_user", "test@example.com", "password123")
-                    f.write(f"Registration result: {result}\n")
-                except Exception as reg_error:
-                    f.write(f"❌ Registration failed: {reg_error}\n")
+                result = auth_manager.register_user(
+                    "test_user", "test@example.com", "password123")
+                write(f"Registration result: {result}\n")
+            except Exception as reg_error:
+                write(f"❌ Registration failed: {reg_error}\n")
 
-            except Exception as auth_error:
-                f.write(
-                    f"❌ AuthenticationManager creation failed: {auth_error}\n")
-                import traceback
-                f.write(traceback.format_exc())
-                f.write("\n")
+        except Exception as auth_error:
+            write(
+                f"❌ AuthenticationManager creation failed: {auth_error}\n")
+            write(format_error(auth_error))
+            write("\n")
 
-        except Exception as e:
-            f.write(f"❌ Critical error: {e}\n")
-            import traceback
-            f.write(traceback.format_exc())
-            f.write("\n")
+    except Exception as e:
+        write(f"❌ Critical error: {e}\n")
+        write(format_error(e))
+        write("\n")
 
-        f.write("\n" + "=" * 50 + "\n")
-        f.write("Auth debug completed\n")
+    save_report(buf, 'auth_debug.txt', "Auth debug completed")
 
 
 if __name__ == "__main__":
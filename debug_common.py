@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the debug_* scripts
+"""
+
+import io
+import sys
+import os
+import traceback
+from functools import lru_cache
+
+_D = os.path.dirname(__file__) or '.'
+if _D not in sys.path:
+    sys.path.insert(0, _D)
+
+REPORT_BUFFER_SIZE = 131072
+BANNER = "=" * 50
+
+# Full tracebacks read every frame's source file; only dump them on request
+SHOW_TRACEBACK = bool(os.environ.get('PACHINKO_TB'))
+
+
+def start_report(title):
+    """Create an in-memory report and write its banner."""
+    buf = io.StringIO()
+    buf.write(f"{title}\n")
+    buf.write(BANNER + "\n\n")
+    return buf
+
+
+def save_report(buf, path, footer):
+    """Write the closing banner and flush the report to path in one call."""
+    buf.write("\n" + BANNER + "\n")
+    buf.write(f"{footer}\n")
+
+    with open(path, 'w', encoding='utf-8',
+              buffering=REPORT_BUFFER_SIZE) as f:
+        f.write(buf.getvalue())
+
+
+def format_error(exc):
+    """Format exc for a report: a full traceback only when PACHINKO_TB is set."""
+    if SHOW_TRACEBACK:
+        return traceback.format_exc()
+    return "".join(traceback.format_exception_only(type(exc), exc))
+
+
+@lru_cache(maxsize=None)
+def get_auth_manager(db_path="pachinko_auth.db"):
+    """Build the AuthenticationManager once per process."""
+    from src.authentication import AuthenticationManager
+    return AuthenticationManager(db_path=db_path)
+
+
+@lru_cache(maxsize=None)
+def get_db_manager(encrypted=False):
+    """Build the DatabaseManager once per process, optionally with encryption."""
+    from src.config import get_config
+    from src.database import DatabaseManager
+
+    encryption_manager = get_auth_manager() if encrypted else None
+    return DatabaseManager(encryption_manager=encryption_manager,
+                           config=get_config())
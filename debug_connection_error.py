@@ -3,131 +3,127 @@
 Debug the specific connection error with value 0
 """
 
-import sys
 import os
 import sqlite3
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from debug_common import (start_report, save_report, get_db_manager,
+                          format_error)
 
 
 def debug_connection_error():
-    with open('connection_error_debug.txt', 'w', encoding='utf-8') as f:
-        f.write("🔍 Connection Error Debug (Error: 0)\n")
-        f.write("=" * 50 + "\n\n")
+    buf = start_report("🔍 Connection Error Debug (Error: 0)")
+    write = buf.write
 
-        try:
-            # Test direct SQLite connection
-            f.write("1. Testing direct SQLite connection...\n")
-            try:
-                conn = sqlite3.connect('pachinko_data.db')
-                f.write("✅ Direct SQLite connection successful\n")
-
-                # Test basic query
-                cursor = conn.execute("SELECT COUNT(*) FROM game_sessions")
-                count = cursor.fetchone()[0]
-                f.write(f"✅ Query successful, sessions count: {count}\n")
-                conn.close()
+    # Read-only connection shared by every direct SQLite probe below
+    shared_conn = None
 
-            except Exception as sqlite_error:
-                f.write(f"❌ Direct SQLite connection failed: {sqlite_error}\n")
-                f.write(f"Error type: {type(sqlite_error)}\n")
-                f.write(f"Error args: {sqlite_error.args}\n")
+    try:
+        # Test direct SQLite connection
+        write("1. Testing direct SQLite connection...\n")
+        try:
+            shared_conn = sqlite3.connect('file:pachinko_data.db?mode=ro',
+                                          uri=True)
+            shared_conn.execute("PRAGMA query_only=1")
+            write("✅ Direct SQLite connection successful\n")
+
+            # Test basic query
+            cursor = shared_conn.execute("SELECT COUNT(*) FROM game_sessions")
+            count = cursor.fetchone()[0]
+            write(f"✅ Query successful, sessions count: {count}\n")
+
+        except Exception as sqlite_error:
+            write(f"❌ Direct SQLite connection failed: {sqlite_error}\n")
+            write(f"Error type: {type(sqlite_error)}\n")
+            write(f"Error args: {sqlite_error.args}\n")
+
+        write("\n2. Testing DatabaseManager connection...\n")
+        try:
+            db_manager = get_db_manager()
+            write("✅ DatabaseManager created\n")
 
-            f.write("\n2. Testing DatabaseManager connection...\n")
+            # Test connection context manager
             try:
-                from src.database import DatabaseManager
-                from src.config import get_config
+                with db_manager._get_connection() as conn:
+                    write("✅ DatabaseManager connection successful\n")
+                    cursor = conn.execute(
+                        "SELECT COUNT(*) FROM game_sessions")
+                    count = cursor.fetchone()[0]
+                    write(
+                        f"✅ DatabaseManager query successful, count: {count}\n")
+
+            except Exception as conn_error:
+                write(
+                    f"❌ DatabaseManager connection failed: {conn_error}\n")
+                write(f"Error type: {type(conn_error)}\n")
+                write(f"Error args: {conn_error.args}\n")
+                write(f"Error repr: {repr(conn_error)}\n")
+
+                # Check if it's the mysterious "0" error
+                if conn_error.args in ((0,), ("0",)):
+                    write("🚨 Found the mysterious '0' error!\n")
+                    write(
+                        "This suggests an exception with numeric value 0\n")
+
+        except Exception as db_error:
+            write(f"❌ DatabaseManager creation failed: {db_error}\n")
+            write(format_error(db_error))
+
+        write("\n3. Testing config values...\n")
+        try:
+            from src.config import get_config
+            config = get_config()
+            db_config = config.get_database_config()
+            write(f"Database config: {db_config}\n")
 
-                config = get_config()
-                db_manager = DatabaseManager(config=config)
-                f.write("✅ DatabaseManager created\n")
+            # Check file permissions
+            db_path = db_config.get('path', 'pachinko_data.db')
+            try:
+                stat = os.stat(db_path)
+            except FileNotFoundError:
+                write(f"❌ Database file missing: {db_path}\n")
+            else:
+                write(f"Database file exists: {db_path}\n")
+                write(f"File size: {stat.st_size} bytes\n")
+                write(f"File permissions: {oct(stat.st_mode)}\n")
+
+        except Exception as config_error:
+            write(f"❌ Config test failed: {config_error}\n")
+
+        write("\n4. Testing with minimal example...\n")
+        try:
+            # Minimal test that mimics the actual usage
+            from contextlib import contextmanager
 
-                # Test connection context manager
+            @contextmanager
+            def test_connection():
+                if shared_conn is None:
+                    raise RuntimeError("Shared SQLite connection unavailable")
                 try:
-                    with db_manager._get_connection() as conn:
-                        f.write("✅ DatabaseManager connection successful\n")
-                        cursor = conn.execute(
-                            "SELECT COUNT(*) FROM game_sessions")
-                        count = cursor.fetchone()[0]
-                        f.write(
-                            f"✅ DatabaseManager query successful, count: {count}\n")
-
-                except Exception as conn_error:
-                    f.write(
-                        f"❌ DatabaseManager connection failed: {conn_error}\n")
-                    f.write(f"Error type: {type(conn_error)}\n")
-                    f.write(f"Error args: {conn_error.args}\n")
-                    f.write(f"Error repr: {repr(conn_error)}\n")
-
-                    # Check if it's the mysterious "0" error
-                    if str(conn_error) == "0":
-                        f.write("🚨 Found the mysterious '0' error!\n")
-                        f.write(
-                            "This suggests an exception with numeric value 0\n")
-
-            except Exception as db_error:
-                f.write(f"❌ DatabaseManager creation failed: {db_error}\n")
-                import traceback
-                f.write(traceback.format_exc())
-
-            f.write("\n3. Testing config values...\n")
-            try:
-                from src.config import get_config
-                config = get_config()
-                db_config = config.get_database_config()
-                f.write(f"Database config: {db_config}\n")
-
-                # Check file permissions
-                db_path = db_config.get('path', 'pachinko_data.db')
-                if os.path.exists(db_path):
-                    stat = os.stat(db_path)
-                    f.write(f"Database file exists: {db_path}\n")
-                    f.write(f"File size: {stat.st_size} bytes\n")
-                    f.write(f"File permissions: {oct(stat.st_mode)}\n")
-                else:
-                    f.write(f"❌ Database file missing: {db_path}\n")
-
-            except Exception as config_error:
-                f.write(f"❌ Config test failed: {config_error}\n")
-
-            f.write("\n4. Testing with minimal example...\n")
-            try:
-                # Minimal test that mimics the actual usage
-                import sqlite3
-                from contextlib import contextmanager
-
-                @contextmanager
-                def test_connection():
-                    conn = None
-                    try:
-                        conn = sqlite3.connect('pachinko_data.db')
-                        conn.row_factory = sqlite3.Row
-                        yield conn
-                    except Exception as e:
-                        if conn:
-                            conn.rollback()
-                        f.write(f"Connection error in context manager: {e}\n")
-                        f.write(f"Error type: {type(e)}\n")
-                        f.write(f"Error repr: {repr(e)}\n")
-                        raise e
-                    finally:
-                        if conn:
-                            conn.close()
-
-                with test_connection() as conn:
-                    f.write("✅ Minimal context manager test successful\n")
-
-            except Exception as minimal_error:
-                f.write(f"❌ Minimal test failed: {minimal_error}\n")
-                f.write(f"Error type: {type(minimal_error)}\n")
-                f.write(f"Error repr: {repr(minimal_error)}\n")
-
-        except Exception as e:
-            f.write(f"❌ Critical error: {e}\n")
-            import traceback
-            f.write(traceback.format_exc())
-
-        f.write("\n" + "=" * 50 + "\n")
-        f.write("Connection error debug completed\n")
+                    shared_conn.row_factory = sqlite3.Row
+                    yield shared_conn
+                except Exception as e:
+                    shared_conn.rollback()
+                    write(f"Connection error in context manager: {e}\n")
+                    write(f"Error type: {type(e)}\n")
+                    write(f"Error repr: {repr(e)}\n")
+                    raise e
+
+            with test_connection() as conn:
+                write("✅ Minimal context manager test successful\n")
+
+        except Exception as minimal_error:
+            write(f"❌ Minimal test failed: {minimal_error}\n")
+            write(f"Error type: {type(minimal_error)}\n")
+            write(f"Error repr: {repr(minimal_error)}\n")
+
+    except Exception as e:
+        write(f"❌ Critical error: {e}\n")
+        write(format_error(e))
+
+    finally:
+        if shared_conn is not None:
+            shared_conn.close()
+
+    save_report(buf, 'connection_error_debug.txt', "Connection error debug completed")
 
 
 if __name__ == "__main__":
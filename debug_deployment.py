@@ -7,43 +7,91 @@ Use this to identify specific package installation issues.
 import sys
 import subprocess
 import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Packages the app cannot start without; checked before everything else
+CRITICAL_PACKAGES = [
+    ('streamlit', 'streamlit'),
+    ('psycopg2', 'psycopg2'),
+]
+
+OPTIONAL_PACKAGES = [
+    ('pandas', 'pandas'),
+    ('plotly', 'plotly'),
+    ('bcrypt', 'bcrypt'),
+    ('cryptography', 'cryptography'),
+    ('dateutil', 'python-dateutil'),
+    ('streamlit_authenticator', 'streamlit-authenticator')
+]
+
+
+def _import_packages(packages):
+    """
+    Import packages concurrently.
+
+    Returns:
+        (modules, failed): modules imported by name, and the package names
+        that failed
+    """
+    modules = {}
+    failed_imports = []
 
-
-def check_package_installation():
-    """Check if all required packages can be imported."""
-
-    required_packages = [
-        ('streamlit', 'streamlit'),
-        ('pandas', 'pandas'),
-        ('plotly', 'plotly'),
-        ('psycopg2', 'psycopg2'),
-        ('bcrypt', 'bcrypt'),
-        ('cryptography', 'cryptography'),
-        ('dateutil', 'python-dateutil'),
-        ('streamlit_authenticator', 'streamlit-authenticator')
-    ]
-
+    # Import concurrently; the C-extension packages dominate the wall time
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        futures = [
+            (executor.submit(importlib.import_module, module_name),
+             module_name, package_name)
+            for module_name, package_name in packages
+        ]
+
+        for future, module_name, package_name in futures:
+            try:
+                modules[module_name] = future.result()
+                print(f"✅ {package_name}: OK")
+            except Exception as e:
+                # Not only ImportError: a package can fail while initialising,
+                # and concurrent imports can hit an import-lock deadlock error
+                print(f"❌ {package_name}: FAILED - {type(e).__name__}: {e}")
+                failed_imports.append(package_name)
+
+    return modules, failed_imports
+
+
+def check_package_installation(verbose=False):
+    """
+    Check if all required packages can be imported.
+
+    Stops after the critical packages if any of them fail, unless verbose
+    is set, in which case every package is still reported.
+
+    Returns:
+        (ok, modules): whether every import succeeded, and the imported
+        modules by name for later checks to reuse
+    """
     print("🔍 Checking package imports...")
     print("=" * 50)
 
-    failed_imports = []
+    modules, failed_imports = _import_packages(CRITICAL_PACKAGES)
 
-    for module_name, package_name in required_packages:
-        try:
-            importlib.import_module(module_name)
-            print(f"✅ {package_name}: OK")
-        except ImportError as e:
-            print(f"❌ {package_name}: FAILED - {e}")
-            failed_imports.append(package_name)
+    if failed_imports and not verbose:
+        print("=" * 50)
+        print(f"❌ Critical packages failed: {failed_imports}")
+        print("Skipping remaining packages (use --verbose to check all)")
+        return False, modules
+
+    optional_modules, optional_failed = _import_packages(OPTIONAL_PACKAGES)
+    modules.update(optional_modules)
+    failed_imports += optional_failed
 
     print("=" * 50)
 
     if failed_imports:
         print(f"❌ Failed imports: {failed_imports}")
-        return False
+        return False, modules
     else:
         print("✅ All packages imported successfully!")
-        return True
+        return True, modules
 
 
 def check_system_info():
@@ -61,24 +109,19 @@ def check_system_info():
         pass
 
 
-def test_database_packages():
-    """Test database-related packages specifically."""
+def test_database_packages(modules=None):
+    """Test database-related packages, reusing already imported modules."""
     print("\n🗄️ Database Package Tests:")
     print("=" * 50)
 
-    # Test psycopg2
-    try:
-        import psycopg2
-        print(f"✅ psycopg2 version: {psycopg2.__version__}")
-    except ImportError as e:
-        print(f"❌ psycopg2 import failed: {e}")
-
-    # Test cryptography
-    try:
-        import cryptography
-        print(f"✅ cryptography version: {cryptography.__version__}")
-    except ImportError as e:
-        print(f"❌ cryptography import failed: {e}")
+    for module_name in ('psycopg2', 'cryptography'):
+        try:
+            module = (modules or {}).get(module_name)
+            if module is None:
+                module = importlib.import_module(module_name)
+            print(f"✅ {module_name} version: {module.__version__}")
+        except ImportError as e:
+            print(f"❌ {module_name} import failed: {e}")
 
 
 def main():
@@ -88,9 +131,11 @@ def main():
 
     check_system_info()
 
-    if check_package_installation():
+    ok, modules = check_package_installation(
+        verbose='--verbose' in sys.argv[1:])
+    if ok:
         print("\n🎉 All basic packages are working!")
-        test_database_packages()
+        test_database_packages(modules)
     else:
         print("\n⚠️ Some packages failed to import.")
         print("Check the Streamlit Cloud logs for more details.")
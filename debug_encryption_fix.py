@@ -3,15 +3,29 @@
 暗号化データの復号化問題をデバッグ・修正するスクリプト
 """
 
-from src.config import get_config
-from src.authentication import AuthenticationManager
-from src.database import DatabaseManager
 import sys
-import os
 import logging
+import traceback
+from functools import lru_cache
+from debug_common import SHOW_TRACEBACK, get_auth_manager, get_db_manager
+from src.database import looks_encrypted
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+@lru_cache(maxsize=4096)
+def _is_encrypted(value):
+    """DatabaseManagerと同じ暗号化判定（店舗名・機種名は繰り返し現れるためキャッシュする）"""
+    return looks_encrypted(value)
+
+
+def _is_encrypted_batch(values):
+    """複数の文字列の暗号化判定をまとめて行う"""
+    return [_is_encrypted(v) for v in values]
+
+
+@lru_cache(maxsize=None)
+def _sessions(user_id):
+    """デバッグ・修正の両方で使うセッションを一度だけ取得する"""
+    return tuple(get_db_manager(encrypted=True).get_sessions(user_id, limit=10))
 
 
 def debug_encryption_issue():
@@ -21,18 +35,12 @@ def debug_encryption_issue():
     try:
         # 認証マネージャーを初期化
         print("1. 認証マネージャーを初期化中...")
-        auth_manager = AuthenticationManager(
-            db_path="pachinko_auth.db"
-        )
+        auth_manager = get_auth_manager()
         print("✅ 認証マネージャー初期化完了")
 
         # データベースマネージャーを初期化
         print("2. データベースマネージャーを初期化中...")
-        config = get_config()
-        db_manager = DatabaseManager(
-            encryption_manager=auth_manager,
-            config=config
-        )
+        db_manager = get_db_manager(encrypted=True)
         print("✅ データベースマネージャー初期化完了")
 
         # 暗号化マネージャーが正しく設定されているかチェック
@@ -46,7 +54,7 @@ def debug_encryption_issue():
         # テストユーザーのセッションデータを取得
         print("4. セッションデータを取得中...")
         user_id = "1"  # デフォルトユーザー
-        sessions = db_manager.get_sessions(user_id, limit=5)
+        sessions = _sessions(user_id)[:5]
 
         if not sessions:
             print("ℹ️ セッションデータが見つかりません")
@@ -56,50 +64,53 @@ def debug_encryption_issue():
 
         # 各セッションの暗号化状態をチェック
         print("5. セッションデータの暗号化状態をチェック中...")
-        for i, session in enumerate(sessions):
-            print(f"\n--- セッション {i+1} ---")
-            print(f"ID: {session.id}")
-            print(f"日付: {session.date}")
-            print(f"店舗名: {session.store_name}")
-            print(f"機種名: {session.machine_name}")
-
-            # 暗号化されているかチェック
-            store_encrypted = db_manager._is_encrypted_data(session.store_name)
-            machine_encrypted = db_manager._is_encrypted_data(
-                session.machine_name)
-
-            print(f"店舗名暗号化: {'はい' if store_encrypted else 'いいえ'}")
-            print(f"機種名暗号化: {'はい' if machine_encrypted else 'いいえ'}")
+        store_flags = _is_encrypted_batch(s.store_name for s in sessions)
+        machine_flags = _is_encrypted_batch(s.machine_name for s in sessions)
+
+        lines = []
+        for i, (session, store_encrypted, machine_encrypted) in enumerate(
+                zip(sessions, store_flags, machine_flags)):
+            lines.append(
+                f"\n--- セッション {i+1} ---\n"
+                f"ID: {session.id}\n"
+                f"日付: {session.date}\n"
+                f"店舗名: {session.store_name}\n"
+                f"機種名: {session.machine_name}\n"
+                f"店舗名暗号化: {'はい' if store_encrypted else 'いいえ'}\n"
+                f"機種名暗号化: {'はい' if machine_encrypted else 'いいえ'}"
+            )
 
             if store_encrypted or machine_encrypted:
-                print("⚠️ 暗号化されたデータが検出されました")
+                lines.append("⚠️ 暗号化されたデータが検出されました")
 
                 # 手動で復号化を試行
                 try:
                     if store_encrypted:
                         decrypted_store = auth_manager.decrypt_data(
                             session.store_name)
-                        print(f"復号化された店舗名: {decrypted_store}")
+                        lines.append(f"復号化された店舗名: {decrypted_store}")
 
                     if machine_encrypted:
                         decrypted_machine = auth_manager.decrypt_data(
                             session.machine_name)
-                        print(f"復号化された機種名: {decrypted_machine}")
+                        lines.append(f"復号化された機種名: {decrypted_machine}")
 
-                    print("✅ 復号化成功")
+                    lines.append("✅ 復号化成功")
 
                 except Exception as e:
-                    print(f"❌ 復号化失敗: {e}")
+                    lines.append(f"❌ 復号化失敗: {e}")
             else:
-                print("✅ データは既に復号化されています")
+                lines.append("✅ データは既に復号化されています")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         print("\n🎯 デバッグ完了")
         return True
 
     except Exception as e:
         print(f"❌ デバッグ中にエラーが発生しました: {e}")
-        import traceback
-        traceback.print_exc()
+        if SHOW_TRACEBACK:
+            traceback.print_exc()
         return False
 
 
@@ -108,15 +119,8 @@ def fix_encryption_display():
     print("\n🔧 暗号化表示の問題を修正中...")
 
     try:
-        # 認証マネージャーを初期化
-        auth_manager = AuthenticationManager(db_path="pachinko_auth.db")
-
-        # データベースマネージャーを初期化
-        config = get_config()
-        db_manager = DatabaseManager(
-            encryption_manager=auth_manager,
-            config=config
-        )
+        # データベースマネージャーを取得（初期化済みのものを再利用）
+        db_manager = get_db_manager(encrypted=True)
 
         # 暗号化マネージャーが設定されていることを確認
         if not db_manager.encryption_manager:
@@ -125,18 +129,18 @@ def fix_encryption_display():
 
         # すべてのセッションを取得して復号化状態をチェック
         user_id = "1"
-        sessions_dict = db_manager.get_sessions_as_dict(user_id, limit=10)
+        sessions = _sessions(user_id)
 
-        print(f"📊 {len(sessions_dict)}件のセッションをチェック中...")
+        print(f"📊 {len(sessions)}件のセッションをチェック中...")
 
         fixed_count = 0
-        for session_data in sessions_dict:
-            store_name = session_data.get('store_name', '')
-            machine_name = session_data.get('machine_name', '')
+        for session in sessions:
+            store_name = session.store_name or ''
+            machine_name = session.machine_name or ''
 
             # 暗号化されているかチェック
-            if db_manager._is_encrypted_data(store_name) or db_manager._is_encrypted_data(machine_name):
-                print(f"🔓 セッション ID {session_data.get('id')} の暗号化データを検出")
+            if _is_encrypted(store_name) or _is_encrypted(machine_name):
+                print(f"🔓 セッション ID {session.id} の暗号化データを検出")
                 fixed_count += 1
 
         if fixed_count > 0:
@@ -149,8 +153,8 @@ def fix_encryption_display():
 
     except Exception as e:
         print(f"❌ 修正中にエラーが発生しました: {e}")
-        import traceback
-        traceback.print_exc()
+        if SHOW_TRACEBACK:
+            traceback.print_exc()
         return False
 
 
@@ -18,19 +18,27 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 
-def demonstrate_encryption_integration():
-    """Demonstrate the encryption integration with database operations."""
+def demonstrate_encryption_integration(auth_manager: AuthenticationManager = None):
+    """
+    Demonstrate the encryption integration with database operations.
+
+    Args:
+        auth_manager: Optional manager to reuse; a temporary one is built if None
+    """
     print("🔐 Demonstrating Data Encryption Integration")
     print("=" * 50)
 
-    # Create temporary databases for demonstration
-    auth_db = tempfile.mktemp(suffix='_auth.db')
-    data_db = tempfile.mktemp(suffix='_data.db')
+    # Create temporary databases for demonstration; the directory also
+    # collects the SQLite -wal/-shm side files
+    tmp_dir = tempfile.TemporaryDirectory()
+    auth_db = os.path.join(tmp_dir.name, 'demo_auth.db')
+    data_db = os.path.join(tmp_dir.name, 'demo_data.db')
 
     try:
         # 1. Initialize authentication manager
         print("\n1. Initializing authentication system...")
-        auth_manager = AuthenticationManager(db_path=auth_db)
+        if auth_manager is None:
+            auth_manager = AuthenticationManager(db_path=auth_db)
 
         # Register a test user
         username = "demo_user"
@@ -47,10 +55,11 @@ def demonstrate_encryption_integration():
 
         # 3. Create test session with sensitive data
         print("\n3. Creating game session with sensitive data...")
+        now = datetime.now()
         test_session = GameSession(
             user_id="demo_user",
-            date=datetime.now(),
-            start_time=datetime.now(),
+            date=now.date(),
+            start_time=now,
             store_name="マルハン新宿東口店",  # Sensitive: store name
             machine_name="CR花の慶次",        # Sensitive: machine name
             initial_investment=20000
@@ -141,45 +150,42 @@ def demonstrate_encryption_integration():
 
     finally:
         # Clean up temporary files
-        for db_file in [auth_db, data_db]:
-            if os.path.exists(db_file):
-                os.unlink(db_file)
+        tmp_dir.cleanup()
+
 
+def demonstrate_security_features(auth_manager: AuthenticationManager = None):
+    """
+    Demonstrate advanced security features.
 
-def demonstrate_security_features():
-    """Demonstrate advanced security features."""
+    Args:
+        auth_manager: Optional manager to reuse; a temporary one is built if None
+    """
     print("\n\n🛡️ Demonstrating Advanced Security Features")
     print("=" * 50)
 
-    auth_db = tempfile.mktemp(suffix='_security.db')
+    tmp_dir = None if auth_manager else tempfile.TemporaryDirectory()
 
     try:
         # Initialize authentication manager
-        auth_manager = AuthenticationManager(db_path=auth_db)
+        if auth_manager is None:
+            auth_manager = AuthenticationManager(
+                db_path=os.path.join(tmp_dir.name, 'demo_security.db'))
 
         # Register test user
         username = "security_test"
         email = "security@example.com"
         password = "SecureTest123!"
 
-        auth_manager.register_user(username, email, password)
+        user_id = auth_manager.register_user(username, email, password)
 
         # 1. Test suspicious activity detection
         print("\n1. Testing suspicious activity detection...")
 
-        # Get user ID
-        with auth_manager._get_auth_connection() as conn:
-            cursor = conn.execute(
-                "SELECT id FROM users WHERE username = ?",
-                (username,)
-            )
-            user_id = cursor.fetchone()['id']
-
         # Simulate suspicious activity
-        for i in range(12):
-            auth_manager._log_security_event(
-                user_id, "LOGIN_FAILED", f"Simulated failed attempt {i+1}"
-            )
+        auth_manager._log_security_events_bulk(user_id, [
+            ("LOGIN_FAILED", f"Simulated failed attempt {i+1}")
+            for i in range(12)
+        ])
 
         is_suspicious, reasons = auth_manager.detect_suspicious_activity(
             user_id)
@@ -229,10 +235,18 @@ def demonstrate_security_features():
 
     finally:
         # Clean up
-        if os.path.exists(auth_db):
-            os.unlink(auth_db)
+        if tmp_dir:
+            tmp_dir.cleanup()
 
 
 if __name__ == "__main__":
-    demonstrate_encryption_integration()
-    demonstrate_security_features()
+    # Block-buffer stdout so the many short prints go out in a few writes
+    sys.stdout.reconfigure(line_buffering=False)
+
+    # Both demos share one authentication manager and database
+    with tempfile.TemporaryDirectory() as shared_dir:
+        shared_auth = AuthenticationManager(
+            db_path=os.path.join(shared_dir, 'demo_auth.db'))
+        demonstrate_encryption_integration(shared_auth)
+        sys.stdout.flush()
+        demonstrate_security_features(shared_auth)
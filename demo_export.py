@@ -6,6 +6,7 @@ import streamlit as st
 from datetime import datetime, timedelta
 import tempfile
 import os
+from itertools import cycle
 
 from src.models import GameSession
 from src.database import DatabaseManager
@@ -13,42 +14,57 @@ from src.stats import StatsCalculator
 from src.ui_manager import UIManager
 
 
+DEMO_SESSION_COUNT = 15
+DEMO_COMPLETED_COUNT = 12
+
+
+def _build_demo_session(i: int, session_date: datetime,
+                        store_name: str, machine_name: str) -> GameSession:
+    """Build the i-th demo session; all but the last few are completed."""
+    session = GameSession(
+        user_id="demo_user",
+        date=session_date,
+        start_time=session_date.replace(hour=10 + (i % 4), minute=0),
+        store_name=store_name,
+        machine_name=machine_name,
+        initial_investment=1000 + (i * 100)
+    )
+
+    # Complete most sessions (leave some incomplete for demo)
+    if i < DEMO_COMPLETED_COUNT:
+        end_time = session_date.replace(hour=14 + (i % 3), minute=30)
+        final_investment = session.initial_investment + (i * 50)
+        # Create realistic profit/loss pattern
+        if i % 3 == 0:  # Win
+            return_amount = final_investment + (i * 300)
+        elif i % 3 == 1:  # Small loss
+            return_amount = final_investment - (i * 100)
+        else:  # Big loss
+            return_amount = final_investment - (i * 200)
+
+        session.complete_session(end_time, final_investment, return_amount)
+
+    return session
+
+
 def create_demo_data(db_manager: DatabaseManager):
     """Create demo data for export demonstration."""
-    demo_sessions = []
     base_date = datetime.now() - timedelta(days=30)
 
     stores = ["パチンコ太郎", "スロット花子", "大当たり次郎"]
     machines = ["CR戦国乙女", "パチスロ北斗の拳", "CRフィーバー", "沖ドキ"]
 
-    for i in range(15):
-        session_date = base_date + timedelta(days=i * 2)
-
-        session = GameSession(
-            user_id="demo_user",
-            date=session_date,
-            start_time=session_date.replace(hour=10 + (i % 4), minute=0),
-            store_name=stores[i % len(stores)],
-            machine_name=machines[i % len(machines)],
-            initial_investment=1000 + (i * 100)
-        )
-
-        # Complete most sessions (leave some incomplete for demo)
-        if i < 12:
-            end_time = session_date.replace(hour=14 + (i % 3), minute=30)
-            final_investment = session.initial_investment + (i * 50)
-            # Create realistic profit/loss pattern
-            if i % 3 == 0:  # Win
-                return_amount = final_investment + (i * 300)
-            elif i % 3 == 1:  # Small loss
-                return_amount = final_investment - (i * 100)
-            else:  # Big loss
-                return_amount = final_investment - (i * 200)
-
-            session.complete_session(end_time, final_investment, return_amount)
-
-        demo_sessions.append(session)
-        db_manager.create_session(session)
+    session_dates = [base_date + timedelta(days=i * 2)
+                     for i in range(DEMO_SESSION_COUNT)]
+    demo_sessions = [
+        _build_demo_session(i, session_date, store_name, machine_name)
+        for i, session_date, store_name, machine_name in zip(
+            range(DEMO_SESSION_COUNT), session_dates,
+            cycle(stores), cycle(machines))
+    ]
+
+    # Insert everything in one transaction
+    db_manager.create_sessions_bulk(demo_sessions)
 
     return demo_sessions
 
@@ -16,9 +16,9 @@ def demonstrate_schema_features():
     """Demonstrate the database schema and migration features."""
     print("=== Database Schema and Migration Demo ===\n")
 
-    # Use temporary database file
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
-        db_path = tmp_file.name
+    # Use a temporary directory so the SQLite -wal/-shm files go with it
+    tmp_dir = tempfile.TemporaryDirectory()
+    db_path = os.path.join(tmp_dir.name, 'demo_schema.db')
 
     try:
         print("1. Creating new database with schema...")
@@ -74,14 +74,14 @@ def demonstrate_schema_features():
         print("  • Database initialization and reset functionality")
         print("  • Data integrity constraints and validation")
 
-        # Clean up
-        os.unlink(db_path)
-
     except Exception as e:
         print(f"✗ Demo failed: {e}")
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+
+    finally:
+        tmp_dir.cleanup()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so the many short prints go out in a few writes
+    sys.stdout.reconfigure(line_buffering=False)
     demonstrate_schema_features()
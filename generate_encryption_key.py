@@ -7,8 +7,7 @@ with the ENCRYPTION_KEY environment variable.
 """
 
 import os
-import secrets
-from cryptography.fernet import Fernet
+import base64
 
 
 def generate_encryption_key():
@@ -17,16 +16,20 @@ def generate_encryption_key():
     print("🔐 Encryption Key Generator")
     print("=" * 50)
 
-    # Method 1: Using Fernet (recommended for cryptography library)
-    fernet_key = Fernet.generate_key()
+    # One read from the OS CSPRNG, split into non-overlapping slices so
+    # the three keys share no bytes: 32 (Fernet) + 16 (hex) + 24 (URL-safe)
+    raw = os.urandom(72)
+
+    # Method 1: Fernet key (same format as Fernet.generate_key())
+    fernet_key = base64.urlsafe_b64encode(raw[:32])
     print(f"Fernet Key (Base64): {fernet_key.decode()}")
 
     # Method 2: 32-character hex string
-    hex_key = os.urandom(32).hex()[:32]
+    hex_key = raw[32:48].hex()
     print(f"32-char Hex Key: {hex_key}")
 
     # Method 3: URL-safe base64 (32 characters)
-    urlsafe_key = secrets.token_urlsafe(24)[:32]  # 24 bytes = 32 base64 chars
+    urlsafe_key = base64.urlsafe_b64encode(raw[48:]).decode()  # 24 bytes = 32 base64 chars
     print(f"URL-safe Key: {urlsafe_key}")
 
     print("\n📋 Streamlit Cloud設定用:")
@@ -3,20 +3,14 @@
 Push Kiro IDE autofix to GitHub
 """
 
+import logging
 import subprocess
-import os
 
+from push_batch import BATCH_PUSH, configure_logging, run_git
 
-def push_autofix():
-    try:
-        os.chdir('/Users/kurosawashun/Desktop/win-or-lose/pachinko-app')
+_LOGGER = logging.getLogger('push_autofix')
 
-        # Add the autofix changes
-        print("Adding Kiro IDE autofix changes to git...")
-        subprocess.run(['git', 'add', 'src/database.py'], check=True)
-
-        # Commit with descriptive message
-        commit_message = """Apply Kiro IDE autofix to database.py
+COMMIT_MESSAGE = b"""Apply Kiro IDE autofix to database.py
 
 - Apply automatic code formatting and style fixes
 - Maintain SQLite-only session creation logic
@@ -26,20 +20,31 @@ def push_autofix():
 This commit applies Kiro IDE's automatic formatting while
 preserving the critical SQLite-only fixes for session creation."""
 
-        print("Committing autofix changes...")
-        subprocess.run(['git', 'commit', '-m', commit_message], check=True)
+
+def push_autofix():
+    try:
+        # Committing with a pathspec stages the file too, so no separate git add
+        _LOGGER.info("Committing autofix changes...")
+        run_git('commit', '-F', '-', '--', 'src/database.py',
+                input=COMMIT_MESSAGE)
+
+        if BATCH_PUSH:
+            _LOGGER.info(
+                "✅ Committed Kiro IDE autofix; push deferred (BATCH_PUSH)")
+            return
 
         # Push to GitHub
-        print("Pushing to GitHub...")
-        subprocess.run(['git', 'push', 'origin', 'main'], check=True)
+        _LOGGER.info("Pushing to GitHub...")
+        run_git('push', 'origin', 'main')
 
-        print("✅ Successfully pushed Kiro IDE autofix to GitHub!")
+        _LOGGER.info("✅ Successfully pushed Kiro IDE autofix to GitHub!")
 
     except subprocess.CalledProcessError as e:
-        print(f"❌ Git operation failed: {e}")
+        _LOGGER.error(f"❌ Git operation failed: {e}\n{e.stderr.strip()}")
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _LOGGER.error(f"❌ Error: {e}")
 
 
 if __name__ == "__main__":
+    configure_logging()
     push_autofix()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Push fixes to GitHub in one batch
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+
+REPO = '/Users/kurosawashun/Desktop/win-or-lose/pachinko-app'
+
+# subprocess only takes its posix_spawn fast path for an absolute executable,
+# close_fds=False and no cwd, so resolve git once and use -C instead of cwd
+GIT = shutil.which('git') or 'git'
+
+# Config for commits in the middle of a batch; the batch syncs once at the end
+NO_FSYNC = ('-c', 'core.fsync=none')
+
+# Set when several push_* scripts run in a row; they only commit and the
+# caller pushes once at the end
+BATCH_PUSH = bool(os.environ.get('BATCH_PUSH'))
+
+_LOGGER = logging.getLogger('push_batch')
+
+
+@dataclass(frozen=True)
+class Fix:
+    """One set of files committed together under one message."""
+    name: str
+    paths: tuple
+    message: bytes
+
+
+DATABASE_FIXES = Fix('database fixes', ('src/database.py',), b"""\
+Improve database connection error handling and debugging
+
+- Add detailed error logging for database connection failures
+- Add timeout parameter to SQLite connections (30 seconds)
+- Add connection test to verify database accessibility
+- Improve error reporting with type and args information
+- Add debug logging for connection attempts and paths
+
+This addresses the 'Database connection error: 0' issue by providing
+better error information and more robust connection handling.""")
+
+LATEST_FIXES = Fix('latest fixes', ('src/database.py',), b"""\
+Add comprehensive database debugging and error handling
+
+- Add detailed debug logging for session creation process
+- Add database type verification in create_session method
+- Add INSERT SQL logging for troubleshooting
+- Improve error handling for both PostgreSQL and SQLite paths
+- Add session ID retrieval debugging with proper error messages
+- Add validation for SQLite lastrowid results
+
+This addresses the KeyError(0) issue by providing detailed debugging
+information and more robust error handling during session creation.""")
+
+CHANGES = Fix('changes', ('src/pachinko_app.py',), b"""\
+Fix database connection error and improve app initialization
+
+- Fix DatabaseManager initialization conflict between db_path and config
+- Remove redundant db_path parameter in PachinkoApp initialization
+- Resolve 'Database connection error: 0' issue
+- Ensure proper component initialization order
+- Add psutil dependency support
+
+This fixes the critical database connection issues that were preventing
+the application from working properly after the previous date field fixes.""")
+
+FINAL_FIX = Fix('final fix', ('src/database.py',), b"""\
+FINAL FIX: Force SQLite usage in create_session method
+
+- Remove PostgreSQL path completely from create_session
+- Force SQLite INSERT SQL regardless of db_type setting
+- Always use cursor.lastrowid for session ID retrieval
+- Add debug logging to verify database type configuration
+- Resolve KeyError(0) by ensuring SQLite path is always used
+
+This definitively fixes the 'Failed to get session ID from PostgreSQL'
+error by forcing SQLite behavior in the session creation process.""")
+
+COMPLETE_FIX = Fix('complete fix', ('src/database.py',), b"""\
+COMPLETE FIX: Force SQLite-only database operations
+
+- Force db_type to 'sqlite' regardless of configuration
+- Remove all PostgreSQL connection paths from _get_connection
+- Simplify connection cleanup to SQLite-only
+- Eliminate PostgreSQL/SQLite branching completely
+- Ensure consistent SQLite behavior throughout application
+
+This definitively resolves the psycopg2.errors.SyntaxError by
+completely removing PostgreSQL code paths and forcing SQLite usage.""")
+
+KIRO_AUTOFIX = Fix('Kiro IDE autofix', ('src/database.py',), b"""\
+Apply Kiro IDE autofix after SQLite-only database fix
+
+- Apply automatic code formatting and optimization
+- Maintain SQLite-only database connection logic
+- Preserve complete database connection fixes
+- Keep simplified connection management
+
+This commit applies Kiro IDE's automatic formatting while
+preserving the critical SQLite-only database implementation.""")
+
+# Has emoji, so it can't be a bytes literal; encoded once at import instead
+ENCRYPTION_FIX = Fix('encryption fix', ('src/config.py',), """\
+Fix dashboard display by disabling encryption in development
+
+- Change default ENABLE_ENCRYPTION from 'true' to 'false'
+- Resolve Base64 encoded text display issue in dashboard
+- Ensure store names and machine names display as plain text
+- Maintain encryption capability for production use
+
+This fixes the dashboard showing encrypted Base64 strings like:
+🏪 Z0FBQUFBQm9peVQ2STBwNVcxX0tLTjhRd2V2RC1obHhTZ3BuOC1XLW83c0ZxYWRYTG93eUM2WVNXVnFqckIwZUdTclZuUTM2eUtyUVl1TTdiTGlUYWZXNlhVMjU3NVdWS3c9PQ==
+🎰 Z0FBQUFBQm9peVQ2Q1dvZGtaNl9xUE9WT3kxdzVTVEFXV1dMVFY0OU02bEVWaDNfS0pQZjhEMmZiNGR3SmpUNzh5T3lpcEw0QTRqYUpLZFJHUjFwSWU0aDdDRnQ2N1UwM3c9PQ==""".encode('utf-8'))
+
+# All fixes by script name, in the order they were first pushed
+FIXES = {
+    'database_fixes': DATABASE_FIXES,
+    'latest_fixes': LATEST_FIXES,
+    'changes': CHANGES,
+    'final_fix': FINAL_FIX,
+    'complete_fix': COMPLETE_FIX,
+    'kiro_autofix': KIRO_AUTOFIX,
+    'encryption_fix': ENCRYPTION_FIX,
+}
+
+
+def run_git(*args, input=None):
+    """Run one git command against REPO, feeding input bytes on stdin.
+
+    git's output is captured once and logged. "nothing to commit" is not
+    treated as a failure, and on real failures the raised error carries
+    git's stderr.
+    """
+    cmd = [GIT, '-C', REPO, *args]
+    result = subprocess.run(cmd, capture_output=True, close_fds=False,
+                            input=input)
+    stdout = result.stdout.decode('utf-8', 'replace')
+    stderr = result.stderr.decode('utf-8', 'replace')
+    output = (stdout + stderr).strip()
+
+    if result.returncode != 0 and 'nothing to commit' not in output:
+        raise subprocess.CalledProcessError(result.returncode, cmd,
+                                            stdout, stderr)
+    if output:
+        _LOGGER.info(output)
+    return result
+
+
+def stage(fixes):
+    """Stage the files of every fix with a single git add.
+
+    The paths go in NUL-separated on stdin so argv stays the same size
+    however many files the batch touches.
+    """
+    paths = dict.fromkeys(p for fix in fixes for p in fix.paths)
+    run_git('add', '--pathspec-from-file=-', '--pathspec-file-nul',
+            input=b'\0'.join(p.encode('utf-8') for p in paths))
+
+
+def has_staged_changes(paths=()):
+    """Return whether the index differs from HEAD (only for paths if given)."""
+    args = [GIT, '-C', REPO, 'diff', '--cached', '--quiet', '--', *paths]
+    result = subprocess.run(args, capture_output=True, close_fds=False)
+    if result.returncode not in (0, 1):
+        raise subprocess.CalledProcessError(
+            result.returncode, args, result.stdout.decode('utf-8', 'replace'),
+            result.stderr.decode('utf-8', 'replace'))
+    return result.returncode == 1
+
+
+def commit(message, paths=(), fsync=True):
+    """Commit the index, feeding the bytes message on stdin to keep argv small.
+
+    With paths, only those paths are committed and the rest of the index
+    is left for later commits. fsync=False skips git's own fsyncs; the
+    caller is then responsible for syncing.
+    """
+    config = () if fsync else NO_FSYNC
+    run_git(*config, 'commit', '-F', '-', '--', *paths, input=message)
+
+
+def group_by_paths(fixes):
+    """Group fixes that commit the same paths, keeping first-seen order.
+
+    Once the union is staged, a second commit of the same paths would be
+    empty, so fixes sharing paths go out as one commit.
+    """
+    groups = {}
+    for fix in fixes:
+        groups.setdefault(fix.paths, []).append(fix)
+    return list(groups.items())
+
+
+def combined_message(fixes):
+    if len(fixes) == 1:
+        return fixes[0].message
+    return b"Apply %d batched fixes\n\n" % len(fixes) + b"\n\n".join(
+        fix.message for fix in fixes)
+
+
+def push():
+    run_git('push', 'origin', 'main')
+
+
+def push_fix(fix):
+    """Add, commit and push a single fix."""
+    try:
+        _LOGGER.info(f"Adding {fix.name} to git...")
+        stage([fix])
+
+        if not has_staged_changes():
+            _LOGGER.info(
+                f"✅ Nothing to commit for {fix.name}; already pushed")
+            return
+
+        _LOGGER.info(f"Committing {fix.name}...")
+        commit(fix.message)
+
+        if BATCH_PUSH:
+            _LOGGER.info(
+                f"✅ Committed {fix.name}; push deferred (BATCH_PUSH)")
+            return
+
+        _LOGGER.info("Pushing to GitHub...")
+        push()
+
+        _LOGGER.info(f"✅ Successfully pushed {fix.name} to GitHub!")
+
+    except subprocess.CalledProcessError as e:
+        _LOGGER.error(f"❌ Git operation failed: {e}\n{e.stderr.strip()}")
+    except Exception as e:
+        _LOGGER.error(f"❌ Error: {e}")
+
+
+def push_all(fixes=tuple(FIXES.values())):
+    """Stage every fix at once, commit each set of paths and push once."""
+    try:
+        _LOGGER.info(f"Adding {len(fixes)} fixes to git...")
+        stage(fixes)
+
+        groups = [(paths, group) for paths, group in group_by_paths(fixes)
+                  if has_staged_changes(paths)]
+        if not groups:
+            _LOGGER.info("✅ Nothing to commit; all fixes already pushed")
+            return
+
+        for i, (paths, group) in enumerate(groups, 1):
+            names = ', '.join(fix.name for fix in group)
+            _LOGGER.info(f"Committing {names}...")
+            commit(combined_message(group), paths, fsync=i == len(groups))
+
+        # The last commit kept git's fsyncs; flush the earlier ones' objects
+        if len(groups) > 1 and hasattr(os, 'sync'):
+            os.sync()
+
+        _LOGGER.info("Pushing to GitHub...")
+        push()
+
+        pushed = sum(len(group) for _, group in groups)
+        _LOGGER.info(f"✅ Successfully pushed {pushed} fixes to GitHub!")
+
+    except subprocess.CalledProcessError as e:
+        _LOGGER.error(f"❌ Git operation failed: {e}\n{e.stderr.strip()}")
+    except Exception as e:
+        _LOGGER.error(f"❌ Error: {e}")
+
+
+def configure_logging():
+    """Send progress messages to stderr as plain lines."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+
+def main(key=None):
+    """Push the fix named key, or every fix when key is None."""
+    configure_logging()
+    if key is None:
+        push_all()
+    else:
+        push_fix(FIXES[key])
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
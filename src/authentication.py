@@ -21,6 +21,10 @@ import base64
 import bcrypt
 import os
 import json
+import copy
+import time
+import functools
+import threading
 from contextlib import contextmanager
 
 
@@ -34,6 +38,32 @@ class SecurityError(Exception):
     pass
 
 
+_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
+
+
+def _ttl_cached(method):
+    """
+    Cache a report method's result per argument tuple for report_cache_ttl seconds.
+
+    Entries live on the instance and are dropped by _invalidate_report_cache,
+    which every write path calls. Results carrying an 'error' key are not cached.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        cached = self._report_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.report_cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        result = method(self, *args, **kwargs)
+        if 'error' not in result:
+            self._report_cache[key] = (now, copy.deepcopy(result))
+        return result
+
+    return wrapper
+
+
 class AuthenticationManager:
     """
     Manages user authentication and security features for the Pachinko Revenue Calculator.
@@ -42,6 +72,24 @@ class AuthenticationManager:
     with protection against common security threats.
     """
 
+    # Per-connection SQLite tuning; journal_mode=WAL is persistent and is
+    # applied once per manager instead
+    _SQLITE_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    # IF NOT EXISTS lets _ensure_auth_indexes add new indexes to databases
+    # created before them
+    _AUTH_INDEX_DDL = (
+        "CREATE INDEX IF NOT EXISTS idx_username ON users(username);",
+        "CREATE INDEX IF NOT EXISTS idx_email ON users(email);",
+        "CREATE INDEX IF NOT EXISTS idx_session_token ON user_sessions(session_token);",
+        "CREATE INDEX IF NOT EXISTS idx_security_logs_user ON security_logs(user_id, timestamp);",
+        "CREATE INDEX IF NOT EXISTS idx_security_logs_ip ON security_logs(ip_address, event_type, timestamp);",
+    )
+
     def __init__(self, db_path: str = "pachinko_auth.db", encryption_key: Optional[bytes] = None):
         """
         Initialize the Authentication Manager.
@@ -52,6 +100,8 @@ class AuthenticationManager:
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+        self._wal_enabled = False
 
         # Initialize encryption
         if encryption_key:
@@ -64,12 +114,37 @@ class AuthenticationManager:
         self.lockout_duration = timedelta(minutes=30)
         self.password_min_length = 8
         self.session_timeout = timedelta(hours=24)
+        self.bcrypt_cost = self._load_bcrypt_cost()
+
+        # Short-lived cache for the aggregate security reports
+        self.report_cache_ttl = 30  # seconds
+        self._report_cache: Dict[tuple, Tuple[float, Any]] = {}
 
         # Initialize database
         self._initialize_auth_database()
 
-        # Initialize authenticator
-        self._initialize_authenticator()
+        # Make sure login credentials exist. The streamlit-authenticator
+        # widget is created by render_login_form, because it renders a
+        # cookie component and the manager may be built inside cached code.
+        self.authenticator = None
+        self._load_credentials()
+
+    def _load_bcrypt_cost(self) -> int:
+        """
+        Read the bcrypt work factor from BCRYPT_COST (default 12, bcrypt's own).
+
+        Raises:
+            SecurityError: If the value is not an integer between 4 and 31
+        """
+        value = os.getenv('BCRYPT_COST', '12')
+        try:
+            cost = int(value)
+        except ValueError:
+            cost = None
+        if cost is None or not 4 <= cost <= 31:
+            raise SecurityError(
+                f"BCRYPT_COST must be an integer between 4 and 31, got {value!r}")
+        return cost
 
     def _generate_cipher_suite(self) -> Fernet:
         """Generate a new cipher suite for data encryption."""
@@ -100,6 +175,7 @@ class AuthenticationManager:
             if self._is_auth_database_initialized():
                 self.logger.info(
                     "Authentication database already initialized, skipping initialization")
+                self._ensure_auth_indexes()
                 return
 
             self.logger.info("Initializing authentication database...")
@@ -151,19 +227,11 @@ class AuthenticationManager:
                     )
                 """)
 
-                # Create indexes
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_username ON users(username);")
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_email ON users(email);")
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_session_token ON user_sessions(session_token);")
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_security_logs_user ON security_logs(user_id, timestamp);")
-
                 conn.commit()
-                self.logger.info(
-                    "Authentication database initialized successfully")
+
+            self._ensure_auth_indexes()
+            self.logger.info(
+                "Authentication database initialized successfully")
 
         except Exception as e:
             self.logger.error(
@@ -172,6 +240,11 @@ class AuthenticationManager:
             self.logger.warning(
                 "Continuing with existing authentication database despite initialization error")
 
+    def _ensure_auth_indexes(self) -> None:
+        """Create any missing authentication database indexes."""
+        with self._get_auth_connection() as conn:
+            conn.executescript("\n".join(self._AUTH_INDEX_DDL))
+
     def _is_auth_database_initialized(self) -> bool:
         """
         Check if the authentication database is already initialized.
@@ -194,11 +267,22 @@ class AuthenticationManager:
 
     @contextmanager
     def _get_auth_connection(self):
-        """Context manager for authentication database connections."""
-        conn = None
+        """
+        Context manager for authentication database connections.
+
+        Each thread keeps its connection open for the life of the manager, so
+        nested calls (login_user logging events, for example) share it.
+        Leaving the outermost block rolls back anything left uncommitted, as
+        closing did.
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        depth = getattr(local, 'depth', 0)
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            if conn is None:
+                conn = self._open_auth_connection()
+                local.conn = conn
+            local.depth = depth + 1
             yield conn
         except sqlite3.Error as e:
             if conn:
@@ -206,23 +290,54 @@ class AuthenticationManager:
             self.logger.error(f"Authentication database error: {e}")
             raise AuthenticationError(f"Database connection failed: {e}")
         finally:
-            if conn:
-                conn.close()
+            local.depth = depth
+            if conn is not None and depth == 0:
+                try:
+                    if conn.in_transaction:
+                        conn.rollback()
+                except sqlite3.ProgrammingError:
+                    # Closed by the caller; open a fresh one next time
+                    local.conn = None
+
+    def _open_auth_connection(self) -> sqlite3.Connection:
+        """Open a tuned connection to the authentication database."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+
+        # WAL lets session checks read while security events are written
+        if not self._wal_enabled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled = True
+        for pragma in self._SQLITE_PRAGMAS:
+            conn.execute(pragma)
+
+        return conn
+
+    def _invalidate_report_cache(self) -> None:
+        """Drop cached security reports after a write to the auth database."""
+        self._report_cache.clear()
+
+    def _load_credentials(self) -> Dict[str, Dict[str, Any]]:
+        """Get user credentials, creating the default admin if there are none."""
+        # Get user credentials from database
+        credentials = self._get_user_credentials()
+
+        if not credentials['usernames']:
+            # Create default admin user if no users exist (skip in production deployment)
+            if os.getenv('ENVIRONMENT', 'development') != 'production':
+                self._create_default_admin()
+                credentials = self._get_user_credentials()
+            else:
+                # In production, use empty credentials to avoid password validation issues
+                credentials = {'usernames': {}, 'emails': {}, 'names': {}}
+
+        return credentials
 
     def _initialize_authenticator(self) -> None:
         """Initialize the streamlit-authenticator."""
         try:
             # Get user credentials from database
-            credentials = self._get_user_credentials()
-
-            if not credentials['usernames']:
-                # Create default admin user if no users exist (skip in production deployment)
-                if os.getenv('ENVIRONMENT', 'development') != 'production':
-                    self._create_default_admin()
-                    credentials = self._get_user_credentials()
-                else:
-                    # In production, use empty credentials to avoid password validation issues
-                    credentials = {'usernames': {}, 'emails': {}, 'names': {}}
+            credentials = self._load_credentials()
 
             # Initialize authenticator
             self.authenticator = stauth.Authenticate(
@@ -327,7 +442,7 @@ class AuthenticationManager:
         """
         try:
             # Generate salt
-            salt = bcrypt.gensalt()
+            salt = bcrypt.gensalt(rounds=self.bcrypt_cost)
 
             # Hash password
             hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
@@ -349,6 +464,11 @@ class AuthenticationManager:
         Returns:
             bool: True if password matches
         """
+        # Reject empty passwords and non-bcrypt hashes without running bcrypt
+        if (not password or not isinstance(hashed_password, str)
+                or not hashed_password.startswith('$2')):
+            return False
+
         try:
             return bcrypt.checkpw(
                 password.encode('utf-8'),
@@ -358,7 +478,7 @@ class AuthenticationManager:
             self.logger.error(f"Password verification failed: {e}")
             return False
 
-    def register_user(self, username: str, email: str, password: str) -> bool:
+    def register_user(self, username: str, email: str, password: str) -> int:
         """
         Register a new user with validation and security checks.
 
@@ -368,7 +488,7 @@ class AuthenticationManager:
             password: Plain text password
 
         Returns:
-            bool: True if registration successful
+            int: ID of the new user (always truthy on success)
 
         Raises:
             AuthenticationError: If registration fails
@@ -379,7 +499,7 @@ class AuthenticationManager:
                 raise AuthenticationError("すべてのフィールドは必須です")
 
             # Validate username format
-            if not re.match(r'^[a-zA-Z0-9_]{3,20}$', username):
+            if not _USERNAME_PATTERN.match(username):
                 raise AuthenticationError("ユーザー名は3-20文字の英数字とアンダースコアのみ使用可能です")
 
             # Validate email format (simplified)
@@ -406,19 +526,21 @@ class AuthenticationManager:
                     raise AuthenticationError("ユーザー名またはメールアドレスが既に使用されています")
 
                 # Insert new user
-                conn.execute("""
+                cursor = conn.execute("""
                     INSERT INTO users (username, email, password_hash, salt)
                     VALUES (?, ?, ?, ?)
                 """, (username, email, hashed_password, salt))
+                user_id = cursor.lastrowid
 
                 conn.commit()
+                self._invalidate_report_cache()
 
                 # Log security event
                 self._log_security_event(
                     None, "USER_REGISTERED", f"New user registered: {username}")
 
                 self.logger.info(f"User registered successfully: {username}")
-                return True
+                return user_id
 
         except AuthenticationError:
             raise
@@ -676,6 +798,36 @@ class AuthenticationManager:
                 """, (user_id, event_type, description, ip_address, user_agent))
 
                 conn.commit()
+                self._invalidate_report_cache()
+
+        except Exception as e:
+            self.logger.error(f"Security logging failed: {e}")
+
+    def _log_security_events_bulk(self, user_id: Optional[int],
+                                  events: List[Tuple[Optional[str], ...]]) -> None:
+        """
+        Log several security events for one user in a single transaction.
+
+        Args:
+            user_id: User ID the events belong to
+            events: (event_type, description[, ip_address[, user_agent]]) tuples
+        """
+        rows = [
+            (user_id, *event, *(None,) * (4 - len(event)))
+            for event in events
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._get_auth_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO security_logs (user_id, event_type, event_description, ip_address, user_agent)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+
+                conn.commit()
+                self._invalidate_report_cache()
 
         except Exception as e:
             self.logger.error(f"Security logging failed: {e}")
@@ -696,50 +848,46 @@ class AuthenticationManager:
         try:
             suspicious_indicators = []
 
+            # Failures from a private address are counted across all users
+            checked_ip = None
+            if ip_address and ip_address.startswith(('127.', '10.', '192.168.', '172.')):
+                checked_ip = ip_address
+
             with self._get_auth_connection() as conn:
-                # Check for rapid login attempts (more than 10 in last hour)
+                # All counters in one pass over the user's last 24 hours
                 cursor = conn.execute("""
-                    SELECT COUNT(*) FROM security_logs 
-                    WHERE user_id = ? AND event_type IN ('LOGIN_FAILED', 'LOGIN_SUCCESS')
-                    AND timestamp > datetime('now', '-1 hour')
-                """, (user_id,))
+                    SELECT
+                        COUNT(CASE WHEN event_type IN ('LOGIN_FAILED', 'LOGIN_SUCCESS')
+                                    AND timestamp > datetime('now', '-1 hour')
+                                   THEN 1 END) AS rapid_attempts,
+                        COUNT(DISTINCT CASE WHEN timestamp > datetime('now', '-2 hours')
+                                            THEN ip_address END) AS ip_count,
+                        COUNT(DISTINCT user_agent) AS agent_count,
+                        COUNT(CASE WHEN event_type = 'LOGIN_FAILED'
+                                    AND timestamp > datetime('now', '-30 minutes')
+                                   THEN 1 END) AS recent_failures,
+                        (SELECT COUNT(*) FROM security_logs
+                         WHERE ip_address = ? AND event_type = 'LOGIN_FAILED'
+                         AND timestamp > datetime('now', '-24 hours')) AS ip_failures
+                    FROM security_logs
+                    WHERE user_id = ? AND timestamp > datetime('now', '-24 hours')
+                """, (checked_ip, user_id))
+                counts = cursor.fetchone()
 
-                rapid_attempts = cursor.fetchone()[0]
-                if rapid_attempts > 10:
+                # Check for rapid login attempts (more than 10 in last hour)
+                if counts['rapid_attempts'] > 10:
                     suspicious_indicators.append("短時間での大量ログイン試行")
 
                 # Check for multiple IP addresses in short time (last 2 hours)
-                cursor = conn.execute("""
-                    SELECT COUNT(DISTINCT ip_address) FROM security_logs 
-                    WHERE user_id = ? AND ip_address IS NOT NULL
-                    AND timestamp > datetime('now', '-2 hours')
-                """, (user_id,))
-
-                ip_count = cursor.fetchone()[0]
-                if ip_count > 3:
+                if counts['ip_count'] > 3:
                     suspicious_indicators.append("複数のIPアドレスからのアクセス")
 
                 # Check for unusual user agent patterns
-                if user_agent:
-                    cursor = conn.execute("""
-                        SELECT COUNT(DISTINCT user_agent) FROM security_logs 
-                        WHERE user_id = ? AND user_agent IS NOT NULL
-                        AND timestamp > datetime('now', '-24 hours')
-                    """, (user_id,))
-
-                    agent_count = cursor.fetchone()[0]
-                    if agent_count > 5:
-                        suspicious_indicators.append("複数のブラウザ/デバイスからのアクセス")
+                if user_agent and counts['agent_count'] > 5:
+                    suspicious_indicators.append("複数のブラウザ/デバイスからのアクセス")
 
                 # Check for failed login patterns (more than 3 failures in last 30 minutes)
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM security_logs 
-                    WHERE user_id = ? AND event_type = 'LOGIN_FAILED'
-                    AND timestamp > datetime('now', '-30 minutes')
-                """, (user_id,))
-
-                recent_failures = cursor.fetchone()[0]
-                if recent_failures > 3:
+                if counts['recent_failures'] > 3:
                     suspicious_indicators.append("短時間での複数回ログイン失敗")
 
                 # Check for access outside normal hours (assuming 6 AM - 11 PM is normal)
@@ -747,19 +895,9 @@ class AuthenticationManager:
                 if current_hour < 6 or current_hour > 23:
                     suspicious_indicators.append("通常時間外のアクセス")
 
-                # Check for known malicious IP patterns (basic check)
-                if ip_address:
-                    # Check for localhost/private IP abuse
-                    if ip_address.startswith(('127.', '10.', '192.168.', '172.')):
-                        cursor = conn.execute("""
-                            SELECT COUNT(*) FROM security_logs 
-                            WHERE ip_address = ? AND event_type = 'LOGIN_FAILED'
-                            AND timestamp > datetime('now', '-24 hours')
-                        """, (ip_address,))
-
-                        ip_failures = cursor.fetchone()[0]
-                        if ip_failures > 20:
-                            suspicious_indicators.append("同一IPからの大量失敗試行")
+                # Check for localhost/private IP abuse
+                if counts['ip_failures'] > 20:
+                    suspicious_indicators.append("同一IPからの大量失敗試行")
 
                 # Log the suspicious activity check
                 if suspicious_indicators:
@@ -818,6 +956,7 @@ class AuthenticationManager:
                     return False
 
                 conn.commit()
+                self._invalidate_report_cache()
 
                 # Log the account lock
                 self._log_security_event(
@@ -974,6 +1113,7 @@ class AuthenticationManager:
             self.logger.error(f"User data decryption failed: {e}")
             raise SecurityError(f"ユーザーデータの復号化に失敗しました: {e}")
 
+    @_ttl_cached
     def get_security_summary(self) -> Dict[str, Any]:
         """Get comprehensive security summary for monitoring."""
         try:
@@ -1062,6 +1202,7 @@ class AuthenticationManager:
                 'error': str(e)
             }
 
+    @_ttl_cached
     def get_security_analytics(self, days: int = 7) -> Dict[str, Any]:
         """
         Get detailed security analytics for the specified period.
@@ -1329,6 +1470,7 @@ class AuthenticationManager:
             self.logger.error(f"Security dashboard rendering failed: {e}")
             st.error(f"セキュリティダッシュボードの表示に失敗しました: {e}")
 
+    @_ttl_cached
     def validate_data_integrity(self) -> Dict[str, Any]:
         """
         Validate the integrity of encrypted data and security logs.
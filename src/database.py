@@ -4,7 +4,9 @@ Database management for the Pachinko Revenue Calculator application.
 
 import sqlite3
 import os
+import re
 import logging
+import threading
 from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 from contextlib import contextmanager
@@ -27,6 +29,30 @@ class DatabaseError(Exception):
     pass
 
 
+# Encrypted fields are base64 of a Fernet token ("gAAAAAB..." + timestamp),
+# so they all start with "Z0FBQUFBQ" regardless of when they were written
+_BASE64_PATTERN = re.compile(r'^[A-Za-z0-9+/=]+$')
+_ENCRYPTED_PREFIXES = ('Z0FBQUFBQ', 'gAAAAA', 'AAAAA')
+_ENCRYPTED_FIELDS = ('store_name', 'machine_name')
+
+
+def looks_encrypted(data) -> bool:
+    """Return whether a stored field looks like an encrypted value."""
+    # Long base64-like string with one of the known encrypted prefixes
+    return (bool(data) and len(data) > 20
+            and _BASE64_PATTERN.match(data) is not None
+            and data.startswith(_ENCRYPTED_PREFIXES))
+
+
+def _plain_fields(store_name, machine_name):
+    """Field encoder used when no encryption manager is set."""
+    return store_name, machine_name
+
+
+def _plain_row(data):
+    """Row decoder used when no encryption manager is set."""
+
+
 class DatabaseManager:
     """
     Manages database operations for the Pachinko Revenue Calculator.
@@ -39,6 +65,75 @@ class DatabaseManager:
     # Database schema version for migration tracking
     CURRENT_SCHEMA_VERSION = 1
 
+    # Force SQLite SQL for this application
+    _INSERT_SESSION_SQL = """
+    INSERT INTO game_sessions (
+        user_id, date, start_time, end_time, store_name, machine_name,
+        initial_investment, final_investment, return_amount, profit,
+        is_completed, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Per-connection SQLite tuning; journal_mode=WAL is persistent and is
+    # applied once per manager instead
+    _SQLITE_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    # SQLite schema; _initialize_schema runs it as a single script
+    _SQLITE_SCHEMA_VERSION_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+
+    _SQLITE_GAME_SESSIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS game_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        date DATE NOT NULL,
+        start_time TIMESTAMP NOT NULL,
+        end_time TIMESTAMP,
+        store_name TEXT NOT NULL,
+        machine_name TEXT NOT NULL,
+        initial_investment INTEGER NOT NULL,
+        final_investment INTEGER,
+        return_amount INTEGER,
+        profit INTEGER,
+        is_completed BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        
+        -- Constraints for data integrity
+        CHECK (initial_investment >= 0),
+        CHECK (final_investment >= 0 OR final_investment IS NULL),
+        CHECK (return_amount >= 0 OR return_amount IS NULL),
+        CHECK (final_investment >= initial_investment OR final_investment IS NULL),
+        CHECK (is_completed = 0 OR (is_completed = 1 AND end_time IS NOT NULL AND final_investment IS NOT NULL AND return_amount IS NOT NULL))
+    );
+    """
+
+    _SQLITE_INDEX_DDL = (
+        # Primary performance indexes as specified in requirements
+        "CREATE INDEX IF NOT EXISTS idx_user_date ON game_sessions(user_id, date);",
+        "CREATE INDEX IF NOT EXISTS idx_user_month ON game_sessions(user_id, strftime('%Y-%m', date));",
+
+        # Additional indexes for query optimization
+        "CREATE INDEX IF NOT EXISTS idx_user_completed ON game_sessions(user_id, is_completed);",
+        "CREATE INDEX IF NOT EXISTS idx_date_desc ON game_sessions(date DESC);",
+        "CREATE INDEX IF NOT EXISTS idx_user_machine ON game_sessions(user_id, machine_name);",
+        "CREATE INDEX IF NOT EXISTS idx_user_store ON game_sessions(user_id, store_name);",
+        "CREATE INDEX IF NOT EXISTS idx_created_at ON game_sessions(created_at);"
+    )
+
+    _SQLITE_SCHEMA_SCRIPT = "\n".join(
+        (_SQLITE_SCHEMA_VERSION_DDL, _SQLITE_GAME_SESSIONS_DDL) + _SQLITE_INDEX_DDL)
+
     def __init__(self, db_path: str = None, encryption_manager=None, config=None):
         """
         Initialize the database manager.
@@ -56,6 +151,9 @@ class DatabaseManager:
         # Force SQLite for this application
         self.db_type = 'sqlite'
         self.connection_pool = None
+        self._wal_enabled = False
+        # One SQLite connection per thread, reused across _get_connection calls
+        self._local = threading.local()
 
         # Set database path for SQLite
         if self.db_type == 'sqlite':
@@ -70,6 +168,48 @@ class DatabaseManager:
 
         self._initialize_database()
 
+    @property
+    def encryption_manager(self):
+        """Encryption manager used for the sensitive session fields, if any."""
+        return self._encryption_manager
+
+    @encryption_manager.setter
+    def encryption_manager(self, encryption_manager):
+        self._encryption_manager = encryption_manager
+        self._bind_field_cipher()
+
+    def _bind_field_cipher(self) -> None:
+        """
+        Pick the field encoder/decoder once for the current encryption manager,
+        so the per-row code doesn't branch on it.
+        """
+        if not self._encryption_manager:
+            self._encrypt_fields = _plain_fields
+            self._decrypt_fields = _plain_row
+            return
+
+        encrypt = self._encryption_manager.encrypt_data
+        decrypt = self._encryption_manager.decrypt_data
+        is_encrypted = self._is_encrypted_data
+
+        def encrypt_fields(store_name, machine_name):
+            return (encrypt(str(store_name)) if store_name else store_name,
+                    encrypt(str(machine_name)) if machine_name else machine_name)
+
+        def decrypt_fields(data):
+            try:
+                # Decrypt only the fields that appear to be encrypted
+                for field in _ENCRYPTED_FIELDS:
+                    if is_encrypted(data[field]):
+                        data[field] = decrypt(data[field])
+
+            except Exception as e:
+                self.logger.warning(f"Failed to decrypt session data: {e}")
+                # Continue with encrypted data rather than failing
+
+        self._encrypt_fields = encrypt_fields
+        self._decrypt_fields = decrypt_fields
+
     def set_encryption_manager(self, encryption_manager):
         """
         Set the encryption manager for data security.
@@ -96,10 +236,7 @@ class DatabaseManager:
                 if current_version == 0:
                     # New database - create all tables and indexes
                     self.logger.info("Initializing new database...")
-                    self._create_schema_version_table(conn)
-                    self._create_tables(conn)
-                    self._create_indexes(conn)
-                    self._set_schema_version(conn, self.CURRENT_SCHEMA_VERSION)
+                    self._initialize_schema(conn)
                     self.logger.info("New database initialized successfully")
                 elif current_version < self.CURRENT_SCHEMA_VERSION:
                     # Existing database - run migrations
@@ -125,13 +262,22 @@ class DatabaseManager:
         """
         Context manager for database connections with automatic cleanup.
 
+        Each thread keeps its connection open for the life of the manager, so
+        PRAGMAs and the page cache carry over between calls. Leaving the
+        outermost block rolls back anything left uncommitted, as closing did.
+
         Yields:
             Database connection (sqlite3.Connection or psycopg2.Connection)
         """
-        conn = None
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        depth = getattr(local, 'depth', 0)
         try:
-            # Force SQLite connection for this application
-            conn = self._get_sqlite_connection()
+            if conn is None:
+                # Force SQLite connection for this application
+                conn = self._get_sqlite_connection()
+                local.conn = conn
+            local.depth = depth + 1
             yield conn
         except Exception as e:
             if conn:
@@ -142,8 +288,14 @@ class DatabaseManager:
             self.logger.error(f"Error repr: {repr(e)}")
             raise DatabaseError(f"Database connection failed: {e}")
         finally:
-            if conn:
-                conn.close()
+            local.depth = depth
+            if conn is not None and depth == 0:
+                try:
+                    if conn.in_transaction:
+                        conn.rollback()
+                except sqlite3.ProgrammingError:
+                    # Closed by the caller; open a fresh one next time
+                    local.conn = None
 
     def _get_sqlite_connection(self):
         """Get SQLite database connection."""
@@ -159,6 +311,13 @@ class DatabaseManager:
             conn = sqlite3.connect(db_path, timeout=30.0)  # Add timeout
             conn.row_factory = sqlite3.Row  # Enable column access by name
 
+            # WAL turns each commit into an append instead of a full sync
+            if not self._wal_enabled:
+                conn.execute("PRAGMA journal_mode=WAL")
+                self._wal_enabled = True
+            for pragma in self._SQLITE_PRAGMAS:
+                conn.execute(pragma)
+
             # Test the connection
             conn.execute("SELECT 1").fetchone()
 
@@ -208,6 +367,28 @@ class DatabaseManager:
             self.logger.error(f"Failed to initialize connection pool: {e}")
             raise DatabaseError(f"Connection pool initialization failed: {e}")
 
+    def _initialize_schema(self, conn) -> None:
+        """
+        Create all tables and indexes on an empty database and record
+        CURRENT_SCHEMA_VERSION. On SQLite the DDL runs as one script.
+
+        Args:
+            conn: Database connection
+        """
+        if self.db_type == 'postgresql':
+            self._create_schema_version_table(conn)
+            self._create_tables(conn)
+            self._create_indexes(conn)
+        else:
+            try:
+                conn.executescript(self._SQLITE_SCHEMA_SCRIPT)
+                self.logger.info("Tables and indexes created successfully")
+            except Exception as e:
+                self.logger.error(f"Failed to create schema: {e}")
+                raise DatabaseError(f"Schema creation failed: {e}")
+
+        self._set_schema_version(conn, self.CURRENT_SCHEMA_VERSION)
+
     def _create_schema_version_table(self, conn) -> None:
         """
         Create the schema_version table for migration tracking.
@@ -224,13 +405,7 @@ class DatabaseManager:
             );
             """
         else:
-            create_version_table_sql = """
-            CREATE TABLE IF NOT EXISTS schema_version (
-                version INTEGER PRIMARY KEY,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            """
+            create_version_table_sql = self._SQLITE_SCHEMA_VERSION_DDL
 
         try:
             cursor = conn.cursor()
@@ -275,31 +450,7 @@ class DatabaseManager:
             );
             """
         else:
-            create_table_sql = """
-            CREATE TABLE IF NOT EXISTS game_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                date DATE NOT NULL,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP,
-                store_name TEXT NOT NULL,
-                machine_name TEXT NOT NULL,
-                initial_investment INTEGER NOT NULL,
-                final_investment INTEGER,
-                return_amount INTEGER,
-                profit INTEGER,
-                is_completed BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                
-                -- Constraints for data integrity
-                CHECK (initial_investment >= 0),
-                CHECK (final_investment >= 0 OR final_investment IS NULL),
-                CHECK (return_amount >= 0 OR return_amount IS NULL),
-                CHECK (final_investment >= initial_investment OR final_investment IS NULL),
-                CHECK (is_completed = 0 OR (is_completed = 1 AND end_time IS NOT NULL AND final_investment IS NOT NULL AND return_amount IS NOT NULL))
-            );
-            """
+            create_table_sql = self._SQLITE_GAME_SESSIONS_DDL
 
         try:
             cursor = conn.cursor()
@@ -336,18 +487,7 @@ class DatabaseManager:
                 "CREATE INDEX IF NOT EXISTS idx_created_at ON game_sessions(created_at);"
             ]
         else:
-            indexes = [
-                # Primary performance indexes as specified in requirements
-                "CREATE INDEX IF NOT EXISTS idx_user_date ON game_sessions(user_id, date);",
-                "CREATE INDEX IF NOT EXISTS idx_user_month ON game_sessions(user_id, strftime('%Y-%m', date));",
-
-                # Additional indexes for query optimization
-                "CREATE INDEX IF NOT EXISTS idx_user_completed ON game_sessions(user_id, is_completed);",
-                "CREATE INDEX IF NOT EXISTS idx_date_desc ON game_sessions(date DESC);",
-                "CREATE INDEX IF NOT EXISTS idx_user_machine ON game_sessions(user_id, machine_name);",
-                "CREATE INDEX IF NOT EXISTS idx_user_store ON game_sessions(user_id, store_name);",
-                "CREATE INDEX IF NOT EXISTS idx_created_at ON game_sessions(created_at);"
-            ]
+            indexes = self._SQLITE_INDEX_DDL
 
         try:
             cursor = conn.cursor()
@@ -374,55 +514,14 @@ class DatabaseManager:
             ValidationError: If session data is invalid
         """
         try:
-            # Validate the session before saving
-            session.validate()
-
-            # Prepare data for encryption if encryption manager is available
-            store_name = session.store_name
-            machine_name = session.machine_name
-
-            if self.encryption_manager:
-                # Encrypt sensitive data
-                session_data = {
-                    'store_name': session.store_name,
-                    'machine_name': session.machine_name
-                }
-                encrypted_data = self.encryption_manager.encrypt_user_data(
-                    session_data)
-                store_name = encrypted_data['store_name']
-                machine_name = encrypted_data['machine_name']
-
-            # Force SQLite SQL for this application
-            insert_sql = """
-            INSERT INTO game_sessions (
-                user_id, date, start_time, end_time, store_name, machine_name,
-                initial_investment, final_investment, return_amount, profit,
-                is_completed, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-
-            values = (
-                session.user_id,
-                session.date.isoformat(),
-                session.start_time.isoformat(),
-                session.end_time.isoformat() if session.end_time else None,
-                store_name,
-                machine_name,
-                session.initial_investment,
-                session.final_investment,
-                session.return_amount,
-                session.profit,
-                session.is_completed,
-                session.created_at.isoformat(),
-                session.updated_at.isoformat()
-            )
+            values = self._session_insert_values(session)
 
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 self.logger.debug(
                     f"Executing INSERT with db_type: {self.db_type}")
-                self.logger.debug(f"INSERT SQL: {insert_sql}")
-                cursor.execute(insert_sql, values)
+                self.logger.debug(f"INSERT SQL: {self._INSERT_SESSION_SQL}")
+                cursor.execute(self._INSERT_SESSION_SQL, values)
 
                 # Force check database type to prevent configuration issues
                 actual_db_type = self.db_config.get('type', 'sqlite')
@@ -451,6 +550,85 @@ class DatabaseManager:
             self.logger.error(f"Failed to create session: {e}")
             raise DatabaseError(f"Session creation failed: {e}")
 
+    def create_sessions_bulk(self, sessions: List[GameSession]) -> List[int]:
+        """
+        Create several game sessions in a single transaction.
+
+        All rows are inserted on one connection and committed once, so the
+        database is synced once per batch instead of once per session.
+
+        Args:
+            sessions: GameSession objects to create
+
+        Returns:
+            List[int]: IDs of the created sessions, in input order
+
+        Raises:
+            DatabaseError: If session creation fails
+            ValidationError: If any session data is invalid
+        """
+        try:
+            # Validate and encrypt everything before touching the database
+            rows = [self._session_insert_values(session)
+                    for session in sessions]
+
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                session_ids = []
+                for values in rows:
+                    cursor.execute(self._INSERT_SESSION_SQL, values)
+                    if cursor.lastrowid is None:
+                        raise DatabaseError(
+                            "SQLite INSERT did not return a valid row ID")
+                    session_ids.append(cursor.lastrowid)
+
+                conn.commit()
+
+            for session, session_id in zip(sessions, session_ids):
+                session.id = session_id
+
+            self.logger.info(f"Created {len(session_ids)} sessions in bulk")
+            return session_ids
+
+        except ValidationError:
+            raise  # Re-raise validation errors as-is
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to create sessions in bulk: {e}")
+            raise DatabaseError(f"Bulk session creation failed: {e}")
+
+    def _session_insert_values(self, session: GameSession) -> Tuple:
+        """
+        Validate a session and build its INSERT parameters.
+
+        Args:
+            session: GameSession object to insert
+
+        Returns:
+            Tuple of values matching _INSERT_SESSION_SQL
+        """
+        # Validate the session before saving
+        session.validate()
+
+        # Encrypt sensitive data if an encryption manager is set
+        store_name, machine_name = self._encrypt_fields(
+            session.store_name, session.machine_name)
+
+        return (
+            session.user_id,
+            session.date.isoformat(),
+            session.start_time.isoformat(),
+            session.end_time.isoformat() if session.end_time else None,
+            store_name,
+            machine_name,
+            session.initial_investment,
+            session.final_investment,
+            session.return_amount,
+            session.profit,
+            session.is_completed,
+            session.created_at.isoformat(),
+            session.updated_at.isoformat()
+        )
+
     def update_session(self, session_id: int, session: GameSession) -> bool:
         """
         Update an existing game session.
@@ -470,20 +648,9 @@ class DatabaseManager:
             # Validate the session before updating
             session.validate()
 
-            # Prepare data for encryption if encryption manager is available
-            store_name = session.store_name
-            machine_name = session.machine_name
-
-            if self.encryption_manager:
-                # Encrypt sensitive data
-                session_data = {
-                    'store_name': session.store_name,
-                    'machine_name': session.machine_name
-                }
-                encrypted_data = self.encryption_manager.encrypt_user_data(
-                    session_data)
-                store_name = encrypted_data['store_name']
-                machine_name = encrypted_data['machine_name']
+            # Encrypt sensitive data if an encryption manager is set
+            store_name, machine_name = self._encrypt_fields(
+                session.store_name, session.machine_name)
 
             update_sql = """
             UPDATE game_sessions SET
@@ -868,20 +1035,7 @@ class DatabaseManager:
         Returns:
             bool: True if data appears to be encrypted
         """
-        if not data or len(data) < 10:
-            return False
-
-        # Check for base64-like patterns (common in encrypted data)
-        import re
-        base64_pattern = r'^[A-Za-z0-9+/=]+$'
-
-        # Check if it's a long base64-like string
-        if len(data) > 20 and re.match(base64_pattern, data):
-            # Additional check: encrypted data often has specific prefixes
-            if data.startswith(('Z0FBQUFBQm', 'gAAAAA', 'AAAAA')):
-                return True
-
-        return False
+        return looks_encrypted(data)
 
     def check_data_integrity(self) -> Dict[str, Any]:
         """
@@ -1152,10 +1306,7 @@ class DatabaseManager:
                         conn.execute(f"DROP TABLE IF EXISTS {table};")
 
                 # Recreate schema
-                self._create_schema_version_table(conn)
-                self._create_tables(conn)
-                self._create_indexes(conn)
-                self._set_schema_version(conn, self.CURRENT_SCHEMA_VERSION)
+                self._initialize_schema(conn)
 
                 conn.commit()
                 self.logger.info("Database reset successfully")
@@ -1190,34 +1341,8 @@ class DatabaseManager:
                            'is_completed', 'created_at', 'updated_at']
                 data = dict(zip(columns, row))
 
-            # Decrypt sensitive data if encryption manager is available
-            if self.encryption_manager:
-                try:
-                    # Check if data appears to be encrypted
-                    store_encrypted = self._is_encrypted_data(
-                        data['store_name'])
-                    machine_encrypted = self._is_encrypted_data(
-                        data['machine_name'])
-
-                    if store_encrypted or machine_encrypted:
-                        decrypted_data = self.encryption_manager.decrypt_user_data({
-                            'store_name': data['store_name'],
-                            'machine_name': data['machine_name'],
-                            'store_name_encrypted': store_encrypted,
-                            'machine_name_encrypted': machine_encrypted
-                        })
-
-                        if store_encrypted:
-                            data['store_name'] = decrypted_data['store_name']
-                        if machine_encrypted:
-                            data['machine_name'] = decrypted_data['machine_name']
-
-                        self.logger.debug(
-                            f"Successfully decrypted session data")
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to decrypt session data: {e}")
-                    # Continue with encrypted data rather than failing
+            # Decrypt sensitive data if an encryption manager is set
+            self._decrypt_fields(data)
 
             # Use the from_dict method to create the GameSession
             return GameSession.from_dict(data)
@@ -7,7 +7,7 @@ import json
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import streamlit as st
 import requests
 from .models import GameSession
@@ -57,7 +57,7 @@ class OfflineStorageManager:
             current_data['last_updated'] = datetime.now().isoformat()
 
             # Streamlitのセッション状態に保存（localStorage代替）
-            st.session_state[self.local_storage_key] = json.dumps(current_data)
+            self._store_local_data(current_data)
 
             self.logger.info(f"データをローカルストレージに保存しました: {data['id']}")
             return True
@@ -66,6 +66,16 @@ class OfflineStorageManager:
             self.logger.error(f"ローカルストレージへの保存に失敗しました: {e}")
             return False
 
+    def _store_local_data(self, data: Dict[str, Any]) -> None:
+        """
+        ローカルデータをJSON文字列としてセッション状態に書き込む
+
+        日本語をエスケープせず区切りの空白も省くため、文字列が短くなり
+        読み込み時のデコードも速くなる（json.loadsでそのまま読める）
+        """
+        st.session_state[self.local_storage_key] = json.dumps(
+            data, ensure_ascii=False, separators=(',', ':'))
+
     def load_from_local_storage(self) -> Optional[Dict[str, Any]]:
         """
         ローカルストレージからデータを読み込み
@@ -88,6 +98,21 @@ class OfflineStorageManager:
             self.logger.error(f"ローカルストレージからの読み込みに失敗しました: {e}")
             return None
 
+    def iter_pending_sessions(self) -> Iterator[Dict[str, Any]]:
+        """
+        同期待ちのセッションデータを1件ずつ返す（リストを作成しない）
+
+        Yields:
+            Dict: 同期待ちのセッション
+        """
+        local_data = self.load_from_local_storage()
+        if not local_data or 'sessions' not in local_data:
+            return
+
+        for session_data in local_data['sessions'].values():
+            if session_data.get('sync_status') == 'pending':
+                yield session_data
+
     def get_pending_sessions(self) -> List[Dict[str, Any]]:
         """
         同期待ちのセッションデータを取得
@@ -96,16 +121,7 @@ class OfflineStorageManager:
             List[Dict]: 同期待ちのセッションリスト
         """
         try:
-            local_data = self.load_from_local_storage()
-            if not local_data or 'sessions' not in local_data:
-                return []
-
-            pending_sessions = []
-            for session_id, session_data in local_data['sessions'].items():
-                if session_data.get('sync_status') == 'pending':
-                    pending_sessions.append(session_data)
-
-            return pending_sessions
+            return list(self.iter_pending_sessions())
 
         except Exception as e:
             self.logger.error(f"同期待ちセッションの取得に失敗しました: {e}")
@@ -286,8 +302,7 @@ class OfflineStorageManager:
                         local_data['sessions'][str(
                             session_id)]['server_id'] = new_id
 
-                    st.session_state[self.local_storage_key] = json.dumps(
-                        local_data)
+                    self._store_local_data(local_data)
 
         except Exception as e:
             self.logger.error(f"同期ステータスの更新に失敗しました: {e}")
@@ -311,7 +326,7 @@ class OfflineStorageManager:
                 del local_data['sessions'][session_id]
 
             # 更新されたデータを保存
-            st.session_state[self.local_storage_key] = json.dumps(local_data)
+            self._store_local_data(local_data)
 
             self.logger.info(f"同期完了データを削除しました: {len(sessions_to_remove)}件")
 
@@ -327,7 +342,7 @@ class OfflineStorageManager:
         """
         try:
             local_data = self.load_from_local_storage()
-            pending_count = len(self.get_pending_sessions())
+            pending_count = sum(1 for _ in self.iter_pending_sessions())
             network_status = self.detect_network_status()
 
             return {
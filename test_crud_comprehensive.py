@@ -8,7 +8,7 @@ from src.models_fixed import GameSession, ValidationError
 import sys
 import os
 import tempfile
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List
 
 # Add src directory to path
@@ -84,6 +84,71 @@ def test_create_session_comprehensive():
         return False
 
 
+def test_create_sessions_bulk():
+    """Test create_sessions_bulk inserts a batch in one transaction."""
+    print("\nTesting create_sessions_bulk method...")
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
+        db_path = tmp_file.name
+
+    try:
+        db_manager = DatabaseManager(db_path)
+
+        # Test 1: Create a batch of sessions
+        sessions = [
+            GameSession(
+                user_id="bulk_user",
+                date=date(2024, 5, 1 + i),
+                start_time=datetime(2024, 5, 1 + i, 10, 0),
+                store_name=f"ホール{i}",
+                machine_name=f"機種{i}",
+                initial_investment=1000 * (i + 1)
+            )
+            for i in range(5)
+        ]
+
+        session_ids = db_manager.create_sessions_bulk(sessions)
+        assert len(session_ids) == 5, "Should return one ID per session"
+        assert [s.id for s in sessions] == session_ids, "Session objects should be updated with IDs"
+        assert len(db_manager.get_sessions("bulk_user")) == 5, "All sessions should be stored"
+        print("✓ Bulk sessions created successfully")
+
+        # Test 2: An invalid session rejects the whole batch
+        invalid_batch = [
+            GameSession(
+                user_id="bulk_user",
+                date=date(2024, 5, 10),
+                start_time=datetime(2024, 5, 10, 10, 0),
+                store_name="ホール",
+                machine_name="機種",
+                initial_investment=1000
+            ),
+            GameSession(
+                user_id="bulk_user",
+                date=date(2024, 5, 11),
+                start_time=datetime(2024, 5, 11, 10, 0),
+                store_name="",  # Invalid empty store name
+                machine_name="機種",
+                initial_investment=1000
+            ),
+        ]
+        try:
+            db_manager.create_sessions_bulk(invalid_batch)
+            assert False, "Should have failed with validation error"
+        except ValidationError:
+            assert len(db_manager.get_sessions("bulk_user")) == 5, "No session from the invalid batch should be stored"
+            print("✓ Invalid batch rejected without partial inserts")
+
+        os.unlink(db_path)
+        return True
+
+    except Exception as e:
+        print(f"✗ create_sessions_bulk test failed: {e}")
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+        return False
+
+
 def test_update_session_comprehensive():
     """Test update_session method comprehensively."""
     print("\nTesting update_session method...")
@@ -429,6 +494,7 @@ if __name__ == "__main__":
 
     success = True
     success &= test_create_session_comprehensive()
+    success &= test_create_sessions_bulk()
     success &= test_update_session_comprehensive()
     success &= test_get_sessions_comprehensive()
     success &= test_gamesession_integration()
@@ -148,6 +148,74 @@ class TestEncryptionSecurity(unittest.TestCase):
         self.assertTrue(is_suspicious)
         self.assertIn("短時間での大量ログイン試行", reasons)
 
+    def test_register_user_returns_id(self):
+        """Test that registration returns the new user's ID."""
+        user_id = self.auth_manager.register_user(
+            "seconduser", "second@example.com", "SecondPass123!")
+
+        with self.auth_manager._get_auth_connection() as conn:
+            cursor = conn.execute(
+                "SELECT username FROM users WHERE id = ?", (user_id,))
+            self.assertEqual(cursor.fetchone()['username'], "seconduser")
+
+    def test_password_hash_cost(self):
+        """Test that hashes use the configured bcrypt cost and still verify."""
+        self.auth_manager.bcrypt_cost = 4
+        hashed, _ = self.auth_manager.hash_password("CostPass123!")
+
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        self.assertTrue(
+            self.auth_manager.verify_password("CostPass123!", hashed))
+        self.assertFalse(
+            self.auth_manager.verify_password("WrongPass123!", hashed))
+        self.assertFalse(
+            self.auth_manager.verify_password("CostPass123!", "not-a-hash"))
+        self.assertFalse(self.auth_manager.verify_password("", hashed))
+        self.assertFalse(
+            self.auth_manager.verify_password("CostPass123!", None))
+
+    def test_bcrypt_cost_setting(self):
+        """Test that BCRYPT_COST defaults to 12 and is range-checked."""
+        self.assertEqual(self.auth_manager.bcrypt_cost, 12)
+
+        for value in ("3", "32", "cheap"):
+            with patch.dict(os.environ, {"BCRYPT_COST": value}):
+                with self.assertRaises(SecurityError):
+                    AuthenticationManager(db_path=self.temp_db.name)
+
+    def test_bulk_security_logging(self):
+        """Test logging several security events in one call."""
+        with self.auth_manager._get_auth_connection() as conn:
+            cursor = conn.execute(
+                "SELECT id FROM users WHERE username = ?",
+                (self.test_username,)
+            )
+            user_id = cursor.fetchone()['id']
+
+        self.auth_manager._log_security_events_bulk(user_id, [
+            ("LOGIN_FAILED", f"Failed attempt {i+1}")
+            for i in range(12)
+        ] + [("LOGIN_FAILED", "With client info", "10.0.0.1", "TestAgent")])
+
+        with self.auth_manager._get_auth_connection() as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) FROM security_logs
+                WHERE user_id = ? AND event_type = 'LOGIN_FAILED'
+            """, (user_id,))
+            self.assertEqual(cursor.fetchone()[0], 13)
+
+            cursor = conn.execute("""
+                SELECT ip_address, user_agent FROM security_logs
+                WHERE user_id = ? AND event_description = 'With client info'
+            """, (user_id,))
+            row = cursor.fetchone()
+            self.assertEqual(row['ip_address'], "10.0.0.1")
+            self.assertEqual(row['user_agent'], "TestAgent")
+
+        is_suspicious, reasons = self.auth_manager.detect_suspicious_activity(
+            user_id)
+        self.assertTrue(is_suspicious)
+
     def test_account_locking_progressive(self):
         """Test progressive account locking."""
         # Get user ID
@@ -23,6 +23,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 sys.path.append('src')
 
 
+def remove_test_database(db_path):
+    """Remove a test database along with its WAL sidecar files."""
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
 def setup_test_environment():
     """Setup test environment with temporary databases."""
     test_db_path = "test_pachinko_data.db"
@@ -31,7 +38,7 @@ def setup_test_environment():
     # Remove existing test databases
     for db_path in [test_db_path, test_auth_db_path]:
         if os.path.exists(db_path):
-            os.remove(db_path)
+            remove_test_database(db_path)
             print(f"Removed existing test database: {db_path}")
 
     return test_db_path, test_auth_db_path
@@ -83,8 +90,7 @@ def test_database_initialization():
 
     finally:
         # Cleanup
-        if os.path.exists(test_db_path):
-            os.remove(test_db_path)
+        remove_test_database(test_db_path)
 
 
 def test_auth_initialization():
@@ -132,8 +138,7 @@ def test_auth_initialization():
 
     finally:
         # Cleanup
-        if os.path.exists(test_auth_db_path):
-            os.remove(test_auth_db_path)
+        remove_test_database(test_auth_db_path)
 
 
 def test_repeated_initialization():
@@ -171,8 +176,7 @@ def test_repeated_initialization():
     finally:
         # Cleanup
         for db_path in [test_db_path, test_auth_db_path]:
-            if os.path.exists(db_path):
-                os.remove(db_path)
+            remove_test_database(db_path)
 
 
 def main():
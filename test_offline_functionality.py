@@ -151,6 +151,38 @@ class TestOfflineStorageManager:
         assert result[0]['id'] == 1
         assert result[0]['sync_status'] == 'pending'
 
+    @patch('streamlit.session_state')
+    def test_iter_pending_sessions(self, mock_session_state, offline_manager, sample_session_data):
+        """同期待ちセッションをジェネレータで順に取得できることをテスト"""
+        pending_session = sample_session_data.copy()
+        pending_session['sync_status'] = 'pending'
+
+        synced_session = sample_session_data.copy()
+        synced_session['id'] = 2
+        synced_session['sync_status'] = 'synced'
+
+        test_data = {
+            'sessions': {
+                '1': pending_session,
+                '2': synced_session
+            }
+        }
+        mock_session_state.__contains__.return_value = True
+        mock_session_state.__getitem__.return_value = json.dumps(test_data)
+
+        # テスト実行
+        result = offline_manager.iter_pending_sessions()
+
+        # 検証
+        assert not isinstance(result, list)
+        sessions = list(result)
+        assert [s['id'] for s in sessions] == [1]
+
+    @patch('streamlit.session_state', {})
+    def test_iter_pending_sessions_empty(self, offline_manager):
+        """ローカルデータがない場合は何も返さないことをテスト"""
+        assert list(offline_manager.iter_pending_sessions()) == []
+
     @patch('requests.get')
     def test_detect_network_status_online(self, mock_get, offline_manager):
         """ネットワーク接続状態（オンライン）の検出をテスト"""